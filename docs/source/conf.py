@@ -21,9 +21,13 @@ extensions = [
     "sphinx.ext.autosummary",
     "sphinx.ext.intersphinx",
     "sphinx.ext.napoleon",
-    "sphinx.ext.viewcode",
 ]
 
+# viewcode re-parses every module's source on each build; skip it for quick
+# local rebuilds with SPHINX_FAST=1
+if os.environ.get("SPHINX_FAST") != "1":
+    extensions.append("sphinx.ext.viewcode")
+
 intersphinx_mapping = {
     "python": ("https://docs.python.org/3/", None),
     "aiohttp": ("https://docs.aiohttp.org/en/stable/", None),
@@ -34,6 +38,10 @@ templates_path = ["_templates"]
 
 autodoc_member_order = "bysource"
 autodoc_typehints = "description"
+autodoc_default_options = {"members": True, "inherited-members": False}
+
+autosummary_generate = True
+autosummary_imported_members = False
 
 # -- Options for HTML output -------------------------------------------------
 
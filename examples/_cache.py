@@ -0,0 +1,73 @@
+"""Small on-disk cache for slowly changing account lookups in the examples.
+
+Linked accounts and billing account details (premise, meter and service point
+numbers, region) rarely change, so repeat runs of an example can reuse them
+instead of issuing the same GraphQL requests again.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup for the examples
+    orjson = None
+
+CACHE_PATH = Path.home() / ".aionatgrid_cache.json"
+DEFAULT_TTL = 24 * 60 * 60  # seconds
+
+T = TypeVar("T")
+
+_entries: dict[str, Any] | None = None
+
+
+def _load() -> dict[str, Any]:
+    global _entries
+    if _entries is None:
+        try:
+            raw = CACHE_PATH.read_bytes()
+            loaded = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (OSError, ValueError):
+            loaded = None
+        # Anything but an object (e.g. a hand-edited file) is treated as empty
+        _entries = loaded if isinstance(loaded, dict) else {}
+    return _entries
+
+
+def _save(entries: dict[str, Any]) -> None:
+    raw = orjson.dumps(entries) if orjson is not None else json.dumps(entries).encode()
+    tmp_path = CACHE_PATH.with_suffix(".tmp")
+    try:
+        # The cache holds account identifiers, so the file is created private to
+        # the user rather than made private after it has been written
+        tmp_path.unlink(missing_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(raw)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        # e.g. a read-only or missing home directory; carry on uncached
+        pass
+
+
+async def get_or_fetch(key: str, ttl: float, fetch: Callable[[], Awaitable[T]]) -> T:
+    """Return the cached value for ``key``, calling ``fetch`` when missing or stale.
+
+    Fresh values are written through to disk immediately.
+    """
+    entries = _load()
+    now = time.time()
+    entry = entries.get(key)
+    if entry is not None and now - entry["stored_at"] < ttl:
+        return entry["value"]
+
+    value = await fetch()
+    entries[key] = {"stored_at": now, "value": value}
+    _save(entries)
+    return value
@@ -0,0 +1,201 @@
+"""Shared helpers for the example scripts."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import importlib.metadata
+import io
+import json
+import os
+import sys
+from collections.abc import Coroutine, Iterable
+from typing import Any
+
+import aiohttp
+
+from _cache import DEFAULT_TTL, get_or_fetch
+from aionatgrid import NationalGridClient
+from aionatgrid.helpers import create_cookie_jar
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup for the examples
+    orjson = None
+
+# Sorting keys only matters for stable diffs (e.g. in CI), so it is opt-in
+PRETTY_SORT = os.environ.get("AIONATGRID_SORT_KEYS") == "1"
+
+try:
+    _VERSION = importlib.metadata.version("aionatgrid")
+except importlib.metadata.PackageNotFoundError:  # running from a checkout via PYTHONPATH=src
+    _VERSION = "0.4.0"
+
+# Accept-Encoding is left to NationalGridClient, which sets it on every request
+_SESSION_HEADERS = {
+    "User-Agent": f"aionatgrid-examples/{_VERSION}",
+}
+
+
+# Flags shared by the examples, built once at import and attached to each
+# example's parser as argparse parents
+_CREDENTIALS_PARSER = argparse.ArgumentParser(add_help=False)
+_CREDENTIALS_PARSER.add_argument("--username", required=True, help="National Grid username")
+_CREDENTIALS_PARSER.add_argument("--password", required=True, help="National Grid password")
+
+_ACCOUNT_PARSER = argparse.ArgumentParser(add_help=False)
+_ACCOUNT_PARSER.add_argument(
+    "--account-number",
+    help="Billing account number (skips the linked accounts lookup)",
+)
+
+_NDJSON_PARSER = argparse.ArgumentParser(add_help=False)
+_NDJSON_PARSER.add_argument(
+    "--ndjson",
+    action="store_true",
+    help="Print one JSON record per line instead of an indented document",
+)
+
+
+def build_parser(
+    description: str, *, account_number: bool = False, ndjson: bool = False
+) -> argparse.ArgumentParser:
+    """Build an example's argument parser from the shared credential and output flags."""
+    parents = [_CREDENTIALS_PARSER]
+    if account_number:
+        parents.append(_ACCOUNT_PARSER)
+    if ndjson:
+        parents.append(_NDJSON_PARSER)
+    return argparse.ArgumentParser(description=description, parents=parents)
+
+
+class _StatusLog:
+    """Collects status lines and writes them to stdout in a single call."""
+
+    def __init__(self) -> None:
+        self._buf = io.StringIO()
+
+    def line(self, text: str = "") -> None:
+        self._buf.write(text)
+        self._buf.write("\n")
+
+    def flush(self) -> None:
+        text = self._buf.getvalue()
+        if text:
+            sys.stdout.write(text)
+            self._buf.seek(0)
+            self._buf.truncate()
+        sys.stdout.flush()
+
+
+log = _StatusLog()
+
+
+def pretty_print(data: object) -> None:
+    """Print ``data`` as indented JSON.
+
+    Keys are sorted when ``AIONATGRID_SORT_KEYS=1`` is set. Uses orjson when
+    it is installed and writes the encoded bytes straight to
+    ``sys.stdout.buffer``; otherwise falls back to the standard library.
+    """
+    # Flush pending status lines first so output stays in order
+    log.flush()
+    if orjson is None:
+        print(json.dumps(data, indent=2, sort_keys=PRETTY_SORT))
+        return
+
+    out = sys.stdout.buffer
+    option = orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if PRETTY_SORT else 0)
+    out.write(orjson.dumps(data, option=option))
+    out.write(b"\n")
+    out.flush()
+
+
+def print_records(records: Iterable[object], *, ndjson: bool = False) -> None:
+    """Print a list of records, optionally as newline-delimited JSON.
+
+    NDJSON encodes one record at a time, so even very large AMI or interval
+    read dumps never hold the full encoded document in memory.
+    """
+    if not ndjson:
+        pretty_print(records if isinstance(records, list) else list(records))
+        return
+
+    log.flush()
+    out = sys.stdout.buffer
+    for record in records:
+        if orjson is not None:
+            out.write(orjson.dumps(record, option=orjson.OPT_SORT_KEYS if PRETTY_SORT else 0))
+        else:
+            out.write(json.dumps(record, sort_keys=PRETTY_SORT).encode())
+        out.write(b"\n")
+    out.flush()
+
+
+@functools.cache
+def shared_cookie_jar() -> aiohttp.CookieJar:
+    """Return one B2C-compatible cookie jar shared by every session in the process.
+
+    This is only safe because each example is a one-shot script running a
+    single event loop; long-lived applications should create their own jar.
+    """
+    return create_cookie_jar()
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create the single session an example uses for all of its requests.
+
+    Every call in an example goes to the same National Grid hosts, so the
+    connector keeps connections alive between calls instead of repeating the
+    TCP and TLS handshakes.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=10,
+        limit_per_host=4,
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+    )
+    return aiohttp.ClientSession(
+        cookie_jar=shared_cookie_jar(),
+        connector=connector,
+        headers=_SESSION_HEADERS,
+    )
+
+
+async def primary_account_number(
+    client: NationalGridClient, account_number: str | None = None
+) -> str | None:
+    """Return ``account_number``, or look up the first linked billing account.
+
+    The linked-accounts query and the per-account queries are served by
+    different GraphQL endpoints, so they cannot share a request. Passing a
+    known account number skips the lookup round trip entirely.
+    """
+    if account_number:
+        return account_number
+
+    log.line("Fetching linked billing accounts...")
+    accounts = await get_or_fetch(
+        f"linked:{client.config.username}", DEFAULT_TTL, client.get_linked_accounts
+    )
+    if not accounts:
+        log.line("No linked billing accounts found.")
+        return None
+
+    log.line(f"Found {len(accounts)} linked account(s).")
+    return accounts[0]["billingAccountId"]
+
+
+def run(main: Coroutine[Any, Any, None]) -> None:
+    """Run an example's ``main`` coroutine, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        runner = asyncio.run
+    else:
+        runner = uvloop.run
+    try:
+        runner(main)
+    finally:
+        log.flush()
@@ -3,54 +3,38 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
-import json
-
-import aiohttp
 
+from _common import build_parser, create_session, log, pretty_print, primary_account_number, run
 from aionatgrid import NationalGridClient, NationalGridConfig
-from aionatgrid.helpers import create_cookie_jar
-
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Fetch billing account information")
-    parser.add_argument("--username", required=True, help="National Grid username")
-    parser.add_argument("--password", required=True, help="National Grid password")
-    return parser.parse_args()
+PARSER = build_parser("Fetch billing account information", account_number=True)
 
 
-def pretty_print(data: object) -> None:
-    print(json.dumps(data, indent=2, sort_keys=True))
+def parse_args() -> argparse.Namespace:
+    return PARSER.parse_args()
 
 
 async def main() -> None:
     args = parse_args()
     config = NationalGridConfig(username=args.username, password=args.password)
 
-    cookie_jar = create_cookie_jar()
-    async with aiohttp.ClientSession(cookie_jar=cookie_jar) as session:
+    async with create_session() as session:
         async with NationalGridClient(config=config, session=session) as client:
-            # First, get linked billing accounts
-            print("Fetching linked billing accounts...")
-            accounts = await client.get_linked_accounts()
-
-            if not accounts:
-                print("No linked billing accounts found.")
+            # Use the given account, or the first (primary) linked billing account
+            billing_account_id = await primary_account_number(client, args.account_number)
+            if billing_account_id is None:
                 return
 
-            # Use the first (primary) billing account
-            billing_account_id = accounts[0]["billingAccountId"]
-            print(f"Found {len(accounts)} linked account(s).")
-            print(f"Primary billing account ID: {billing_account_id}")
-            print()
+            log.line(f"Primary billing account ID: {billing_account_id}")
+            log.line()
 
             # Now fetch detailed information for the primary account
-            print("Fetching billing account information...")
+            log.line("Fetching billing account information...")
             billing_account = await client.get_billing_account(billing_account_id)
 
-            print("Billing Account Information:")
+            log.line("Billing Account Information:")
             pretty_print(billing_account)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -4,70 +4,64 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 from datetime import date
 
-import aiohttp
-
+from _cache import DEFAULT_TTL, get_or_fetch
+from _common import build_parser, create_session, log, pretty_print, primary_account_number, run
 from aionatgrid import NationalGridClient, NationalGridConfig
-from aionatgrid.helpers import create_cookie_jar
-
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Fetch energy usage costs and historical data")
-    parser.add_argument("--username", required=True, help="National Grid username")
-    parser.add_argument("--password", required=True, help="National Grid password")
-    return parser.parse_args()
+PARSER = build_parser("Fetch energy usage costs and historical data", account_number=True)
 
 
-def pretty_print(data: object) -> None:
-    print(json.dumps(data, indent=2, sort_keys=True))
+def parse_args() -> argparse.Namespace:
+    return PARSER.parse_args()
 
 
 async def main() -> None:
     args = parse_args()
     config = NationalGridConfig(username=args.username, password=args.password)
 
-    cookie_jar = create_cookie_jar()
-    async with aiohttp.ClientSession(cookie_jar=cookie_jar) as session:
+    async with create_session() as session:
         async with NationalGridClient(config=config, session=session) as client:
-            # First, get linked billing accounts to obtain an account number
-            print("Fetching linked billing accounts...")
-            accounts = await client.get_linked_accounts()
-
-            if not accounts:
-                print("No linked billing accounts found.")
+            # Use the given account, or the first linked billing account
+            account_number = await primary_account_number(client, args.account_number)
+            if account_number is None:
                 return
 
-            account_number = accounts[0]["billingAccountId"]
-            print(f"Using account: {account_number}")
-            print()
+            log.line(f"Using account: {account_number}")
+            log.line()
+
+            # Historical usages only need the account number, so start fetching
+            # them (last 12 months) while the billing account info is retrieved
+            usages_task = asyncio.create_task(
+                client.get_energy_usages(account_number, months_back=12, first=12)
+            )
 
             # Fetch billing account info to get the region (used as companyCode)
-            print("Fetching billing account info...")
-            billing_account = await client.get_billing_account(account_number)
+            log.line("Fetching billing account info...")
+            billing_account = await get_or_fetch(
+                f"billing:{account_number}",
+                DEFAULT_TTL,
+                lambda: client.get_billing_account(account_number),
+            )
             region = billing_account["region"]
-            print(f"Account region: {region}")
-            print()
+            log.line(f"Account region: {region}")
+            log.line()
 
-            # Fetch energy usage costs for the current month
-            print("Fetching energy usage costs...")
-            today = date.today()
-            costs = await client.get_energy_usage_costs(account_number, today, region)
+            # Fetch energy usage costs for the current month alongside the usages
+            log.line("Fetching energy usage costs and historical energy usages...")
+            costs, usages = await asyncio.gather(
+                client.get_energy_usage_costs(account_number, date.today(), region),
+                usages_task,
+            )
 
-            print("Energy Usage Costs:")
+            log.line("Energy Usage Costs:")
             pretty_print(costs)
-            print()
-
-            # Fetch historical energy usages (last 12 months)
-            print("Fetching historical energy usages...")
-            # usageYearMonth is an integer in YYYYMM format
-            from_month = (today.year - 1) * 100 + today.month
-            usages = await client.get_energy_usages(account_number, from_month, first=12)
+            log.line()
 
-            print("Historical Energy Usages:")
+            log.line("Historical Energy Usages:")
             pretty_print(usages)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
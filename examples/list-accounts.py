@@ -1,30 +1,51 @@
 import argparse
-import asyncio
-
-import aiohttp
 
+from _common import build_parser, create_session, log, run
 from aionatgrid import NationalGridClient, NationalGridConfig
-from aionatgrid.helpers import create_cookie_jar
+from aionatgrid.extractors import extract_billing_account
+from aionatgrid.queries import billing_account_info_request
+
+PARSER = build_parser("List linked billing accounts")
+PARSER.add_argument(
+    "--details",
+    action="store_true",
+    help="Also fetch each account's region and status (one concurrent batch)",
+)
 
 
 def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="List linked billing accounts")
-    parser.add_argument("--username", required=True, help="National Grid username")
-    parser.add_argument("--password", required=True, help="National Grid password")
-    return parser.parse_args()
+    return PARSER.parse_args()
 
 
 async def main() -> None:
     args = parse_args()
     config = NationalGridConfig(username=args.username, password=args.password)
-    cookie_jar = create_cookie_jar()
-    async with aiohttp.ClientSession(cookie_jar=cookie_jar) as session:
+    # One session (and so one connection pool) for the whole run: every call
+    # below reuses its keep-alive connections instead of a new TLS handshake
+    async with create_session() as session:
         async with NationalGridClient(config=config, session=session) as client:
             accounts = await client.get_linked_accounts()
-            print(f"Found {len(accounts)} linked billing account(s):")
-            for account in accounts:
-                print(f"  - {account['billingAccountId']}")
+            log.line(f"Found {len(accounts)} linked billing account(s):")
+            if not args.details:
+                for account in accounts:
+                    log.line(f"  - {account['billingAccountId']}")
+                return
+
+            requests = [
+                billing_account_info_request(
+                    variables={"accountNumber": account["billingAccountId"]}
+                )
+                for account in accounts
+            ]
+            results = await client.execute_many(requests, concurrency=4)
+            for account, result in zip(accounts, results):
+                account_id = account["billingAccountId"]
+                if isinstance(result, BaseException):
+                    log.line(f"  - {account_id}: failed ({type(result).__name__})")
+                    continue
+                info = extract_billing_account(result)
+                log.line(f"  - {account_id}: {info['region']} ({info['status']})")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -1,6 +1,15 @@
-"""Public package exports for aionatgrid."""
+"""Public package exports for aionatgrid.
+
+Exports that pull in aiohttp (and, for the OIDC helpers, PyJWT) are loaded
+lazily on first access, so importing the config, exceptions or models alone
+stays cheap.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from .client import NationalGridClient
 from .config import NationalGridConfig, RetryConfig
 from .exceptions import (
     CannotConnectError,
@@ -11,7 +20,6 @@ from .exceptions import (
     RestAPIError,
     RetryExhaustedError,
 )
-from .helpers import create_cookie_jar
 from .models import (
     AccountLink,
     AccountLinksConnection,
@@ -29,7 +37,17 @@ from .models import (
     MeterConnection,
     ServiceAddress,
 )
-from .oidchelper import LoginData
+
+if TYPE_CHECKING:
+    from .client import NationalGridClient
+    from .helpers import create_cookie_jar
+    from .oidchelper import LoginData
+
+_LAZY_EXPORTS = {
+    "NationalGridClient": ".client",
+    "create_cookie_jar": ".helpers",
+    "LoginData": ".oidchelper",
+}
 
 __all__ = [
     "NationalGridClient",
@@ -62,3 +80,17 @@ __all__ = [
     "MeterConnection",
     "ServiceAddress",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,15 +1,28 @@
-"""Async client for National Grid GraphQL and REST endpoints."""
+"""Async client for National Grid GraphQL and REST endpoints.
+
+Create one :class:`NationalGridClient` (and so one ``aiohttp.ClientSession``)
+per application and reuse it for every call. The session owns the connection
+pool, so reusing it keeps TCP/TLS connections alive between requests instead
+of paying a new handshake each time.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import copy
+import json as _stdlib_json
 import logging
 import random
 import time
-from collections.abc import Mapping
-from datetime import date, datetime
-from typing import Any
-from urllib.parse import urljoin
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine, Hashable, Mapping, Sequence
+from dataclasses import replace
+from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, TypeVar
+from urllib.parse import urlsplit
 
 import aiohttp
 
@@ -25,6 +38,7 @@ from .extractors import (
     extract_linked_accounts,
 )
 from .graphql import GraphQLRequest, GraphQLResponse
+from .helpers import create_cookie_jar
 from .models import (
     AccountLink,
     AmiEnergyUsage,
@@ -38,21 +52,162 @@ from .queries import (
     ami_energy_usages_request,
     billing_account_info_request,
     energy_usage_costs_request,
+    energy_usage_summary_request,
     energy_usages_request,
     linked_billing_accounts_request,
 )
-from .rest import RestResponse
+from .ratelimit import TokenBucket
+from .rest import RestRequest, RestResponse
 from .rest_queries import realtime_meter_info_request
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _json_loads: Callable[[str | bytes], Any] = _stdlib_json.loads
+
+    def _stdlib_json_encode(obj: Any) -> bytes:
+        return _stdlib_json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_encode: Callable[[Any], bytes] = _stdlib_json_encode
+else:
+    _json_loads = orjson.loads
+    _json_encode = orjson.dumps
+
 # Buffer time before actual expiration to refresh token (5 minutes)
 TOKEN_EXPIRY_BUFFER_SECONDS = 300
 
+# With background refresh on, log in again this long before a request would
+BACKGROUND_REFRESH_LEAD_SECONDS = 60
+
+# Response bodies larger than this (bytes) are decoded in a worker thread
+THREADED_DECODE_THRESHOLD = 512 * 1024
+
+# Retryable exception classes. ServerDisconnectedError is a ClientConnectionError, and
+# aiohttp.ServerTimeoutError is both a ClientConnectionError and a TimeoutError
+_CONNECTION_ERRORS = (aiohttp.ClientConnectionError,)
+_TIMEOUT_ERRORS = (asyncio.TimeoutError,)
+
+# In-flight key for the OIDC login; request keys are tuples, so it can't collide
+_LOGIN_KEY = "login"
+
+
+def _year_month_back(today: date, months_back: int) -> int:
+    """Return the YYYYMM integer ``months_back`` months before ``today``'s month."""
+    year, month_index = divmod(today.year * 12 + today.month - 1 - months_back, 12)
+    return year * 100 + month_index + 1
+
+
+def _retry_after_seconds(error: Exception | None) -> float | None:
+    """Return the ``Retry-After`` delay from a failed response, if it sent one."""
+    if isinstance(error, (GraphQLError, RestAPIError)):
+        error = error.original_error
+    if not isinstance(error, aiohttp.ClientResponseError) or not error.headers:
+        return None
+    value = error.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _is_mutation(query: str) -> bool:
+    return query.lstrip().startswith("mutation")
+
+
+def _items_key(mapping: Mapping[str, str] | None) -> tuple[tuple[str, str], ...]:
+    return tuple(sorted(mapping.items())) if mapping else ()
+
+
+def _copy_graphql_response(response: GraphQLResponse) -> GraphQLResponse:
+    """Return a deep copy, so a caller mutating its response can't affect others."""
+    return copy.deepcopy(response)
+
+
+def _copy_rest_response(response: RestResponse) -> RestResponse:
+    """Return a copy with its own ``data``; the header proxy is read-only already."""
+    return replace(response, data=copy.deepcopy(response.data))
+
+
+@lru_cache(maxsize=8)
+def _client_timeout(total: float) -> aiohttp.ClientTimeout:
+    # ClientTimeout is immutable, so instances can be shared across calls
+    return aiohttp.ClientTimeout(total=total)
+
+
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a JSON response body, or return ``None`` for an empty body.
+
+    Like ``response.json(content_type=None)``, but the raw bytes go straight
+    to the decoder, so orjson skips building an intermediate ``str``.
+    """
+    body = await response.read()
+    if not body.strip():
+        return None
+    if len(body) > THREADED_DECODE_THRESHOLD:
+        # Decoding this much takes long enough to stall other tasks; in a worker
+        # thread the event loop still gets turns at each GIL switch interval
+        return await asyncio.to_thread(_json_loads, body)
+    return _json_loads(body)
+
+
+async def _gather_bounded(
+    coros: Sequence[Coroutine[Any, Any, T]], concurrency: int
+) -> list[T | BaseException]:
+    """Await ``coros`` with at most ``concurrency`` running at once, keeping their order."""
+    if concurrency < 1:
+        for coro in coros:
+            coro.close()
+        raise ValueError("concurrency must be at least 1.")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(coro: Coroutine[Any, Any, T]) -> T:
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(_run(coro) for coro in coros), return_exceptions=True)
+
 
 class NationalGridClient:
     """High-level client that reuses an aiohttp session."""
 
+    __slots__ = (
+        "_access_token",
+        "_auth",
+        "_authorization",
+        "_base_headers",
+        "_config",
+        "_default_authorization",
+        "_default_content_type",
+        "_default_timeout",
+        "_etag_cache",
+        "_inflight",
+        "_login_data",
+        "_needs_auth",
+        "_owns_session",
+        "_rate_limiters",
+        "_refresh_task",
+        "_request_semaphore",
+        "_rest_base_prefix",
+        "_rng",
+        "_session",
+        "_session_lock",
+        "_token_valid_until",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         config: NationalGridConfig | None = None,
@@ -63,10 +218,35 @@ class NationalGridClient:
         self._session = session
         self._owns_session = session is None
         self._access_token: str | None = None
-        self._token_expires_at: float | None = None
-        self._auth_lock = asyncio.Lock()
+        # Monotonic deadline for reusing the token, with the expiry buffer already applied
+        self._token_valid_until = 0.0
+        self._auth = NationalGridAuth()
+        # Credentials are read once, like the header and URL snapshots below
+        self._needs_auth = bool(self._config.username and self._config.password)
         self._session_lock = asyncio.Lock()
         self._login_data: LoginData = {}
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._default_timeout = aiohttp.ClientTimeout(total=self._config.timeout)
+        # Headers that are the same on every call, built once; see _build_headers
+        self._base_headers = self._config.build_headers(content_type=None)
+        # default_headers are already in the template and win over these two
+        self._default_content_type = "Content-Type" in self._config.default_headers
+        self._default_authorization = "Authorization" in self._config.default_headers
+        self._authorization: tuple[str, str] | None = None
+        # Relative REST paths are appended to this, avoiding a urljoin parse per call
+        rest_base_url = self._config.rest_base_url
+        self._rest_base_prefix = rest_base_url.rstrip("/") + "/" if rest_base_url else None
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._rate_limiters: dict[str, TokenBucket] = {}
+        # Backoff jitter only; a private generator keeps clients independent
+        self._rng = random.Random()
+        # REST GET responses keyed by URL and params, for If-None-Match revalidation
+        self._etag_cache: OrderedDict[Hashable, tuple[str, RestResponse]] = OrderedDict()
+        self._request_semaphore = (
+            asyncio.Semaphore(self._config.max_concurrent_requests)
+            if self._config.max_concurrent_requests
+            else None
+        )
 
     @property
     def config(self) -> NationalGridConfig:
@@ -85,31 +265,116 @@ class NationalGridClient:
         await self.close()
 
     async def close(self) -> None:
+        # Stop the background refresh and any login still running on the session
+        pending = [
+            task
+            for task in (self._refresh_task, self._inflight.get(_LOGIN_KEY))
+            if task is not None and not task.done()
+        ]
+        self._refresh_task = None
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
         if self._session and not self._session.closed and self._owns_session:
             await self._session.close()
             self._session = None
 
-    def _calculate_retry_delay(self, attempt: int, retry_config: RetryConfig) -> float:
+    def _request_slot(self) -> contextlib.AbstractAsyncContextManager[Any]:
+        """Return a context manager that holds a slot while a request is in flight."""
+        if self._request_semaphore is None:
+            return contextlib.nullcontext()
+        return self._request_semaphore
+
+    def _build_headers(
+        self,
+        extra_headers: Mapping[str, str] | None,
+        *,
+        access_token: str | None,
+        content_type: str | None = "application/json",
+    ) -> dict[str, str]:
+        """Return the same headers as ``config.build_headers`` from a prebuilt template."""
+        headers = self._base_headers.copy()
+        if content_type and not self._default_content_type:
+            headers["Content-Type"] = content_type
+        if access_token and not self._default_authorization:
+            if self._authorization is None or self._authorization[0] != access_token:
+                self._authorization = (access_token, f"Bearer {access_token}")
+            headers["Authorization"] = self._authorization[1]
+        if extra_headers:
+            headers.update(extra_headers)
+        return headers
+
+    async def _throttle(self, url: str) -> None:
+        """Wait for the host's rate limit, when ``requests_per_second`` is configured."""
+        if self._config.requests_per_second is None:
+            return
+        host = urlsplit(url).hostname or ""
+        bucket = self._rate_limiters.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self._config.requests_per_second, self._config.rate_limit_burst)
+            self._rate_limiters[host] = bucket
+        await bucket.acquire()
+
+    def _pause_host(self, url: str, error: aiohttp.ClientResponseError) -> None:
+        """Hold back further requests to a host that answered 429 with Retry-After."""
+        bucket = self._rate_limiters.get(urlsplit(url).hostname or "")
+        retry_after = _retry_after_seconds(error)
+        if bucket is not None and retry_after:
+            bucket.pause(retry_after)
+
+    def _request_timeout(self, timeout: float | None) -> aiohttp.ClientTimeout:
+        """Return the ClientTimeout for a call, reusing instances for repeated values."""
+        if not timeout:
+            return self._default_timeout
+        return _client_timeout(timeout)
+
+    def _calculate_retry_delay(
+        self,
+        attempt: int,
+        retry_config: RetryConfig,
+        error: Exception | None = None,
+        *,
+        previous_delay: float | None = None,
+    ) -> float:
         """Calculate retry delay with exponential backoff and jitter.
 
+        A ``Retry-After`` header on the failed response (e.g. a 429 or 503)
+        takes precedence over the backoff, capped at ``max_delay``.
+
         Args:
             attempt: Current attempt number (0-indexed)
             retry_config: Retry configuration
+            error: The exception that triggered the retry
+            previous_delay: The delay before this attempt, for decorrelated jitter
 
         Returns:
             Delay in seconds before next retry
         """
-        # Exponential backoff: initial_delay * (base ^ attempt)
-        delay = retry_config.initial_delay * (retry_config.exponential_base**attempt)
+        retry_after = _retry_after_seconds(error)
+        if retry_after is not None:
+            return min(retry_after, retry_config.max_delay)
+
+        if retry_config.jitter_mode == "decorrelated":
+            # Each delay is drawn from [initial_delay, 3 * previous delay]
+            base = retry_config.initial_delay
+            return min(
+                retry_config.max_delay, self._rng.uniform(base, (previous_delay or base) * 3)
+            )
 
-        # Cap at max_delay
-        delay = min(delay, retry_config.max_delay)
+        # Exponential backoff: initial_delay * (base ^ attempt), capped at max_delay
+        delay = min(
+            retry_config.initial_delay * (retry_config.exponential_base**attempt),
+            retry_config.max_delay,
+        )
 
-        # Add jitter (±25% random variation) to prevent thundering herd
-        jitter = delay * 0.25 * (2 * random.random() - 1)
-        delay_with_jitter = delay + jitter
+        if retry_config.jitter_mode == "symmetric":
+            # ±25% random variation around the backoff
+            return max(0, delay + delay * 0.25 * (2 * self._rng.random() - 1))
 
-        return max(0, delay_with_jitter)
+        # Full jitter spreads simultaneous retries across the whole window,
+        # so clients failing together don't retry together
+        return self._rng.uniform(0, delay)
 
     def _should_retry(self, error: Exception, attempt: int, retry_config: RetryConfig) -> bool:
         """Determine if request should be retried based on error and config.
@@ -127,39 +392,58 @@ class NationalGridClient:
             return False
 
         # Extract original error from wrapped exceptions
-        check_error = error
+        status: int | None = None
+        check_error: BaseException = error
         if isinstance(error, (GraphQLError, RestAPIError)):
+            status = error.status
             if error.original_error:
                 check_error = error.original_error
 
         # Retry on connection errors
-        if retry_config.retry_on_connection_errors and isinstance(
-            check_error, (aiohttp.ClientConnectionError, aiohttp.ServerDisconnectedError)
-        ):
+        if retry_config.retry_on_connection_errors and isinstance(check_error, _CONNECTION_ERRORS):
             return True
 
         # Retry on timeout errors
-        if retry_config.retry_on_timeout and isinstance(
-            check_error, (aiohttp.ServerTimeoutError, asyncio.TimeoutError)
-        ):
+        if retry_config.retry_on_timeout and isinstance(check_error, _TIMEOUT_ERRORS):
             return True
 
-        # Retry on specific HTTP status codes
+        # Prefer the HTTP status from the response, else the one on our custom error
         if isinstance(check_error, aiohttp.ClientResponseError):
-            if check_error.status in retry_config.retry_on_status:
-                return True
-            # Also retry on 401 to trigger re-auth (but only once)
-            if check_error.status == 401 and attempt == 0:
-                return True
-
-        # Also check status directly on our custom errors
-        if isinstance(error, (GraphQLError, RestAPIError)):
-            if error.status and error.status in retry_config.retry_on_status:
-                return True
-            if error.status == 401 and attempt == 0:
-                return True
+            status = check_error.status
+        if not status:
+            return False
+        # Also retry on 401 to trigger re-auth (but only once)
+        return status in retry_config.retry_on_status or (status == 401 and attempt == 0)
 
-        return False
+    async def _single_flight(
+        self,
+        key: Hashable,
+        send: Callable[[], Coroutine[Any, Any, T]],
+        copy_result: Callable[[T], T] | None = None,
+    ) -> T:
+        """Share one in-flight request between concurrent callers with the same ``key``.
+
+        The caller that started the request gets its result; callers that joined
+        it get ``copy_result(result)`` when given, so mutable results aren't shared.
+        """
+        task = self._inflight.get(key)
+        joined = task is not None
+        if task is None:
+            task = asyncio.ensure_future(send())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        # Shield so one caller being cancelled doesn't cancel the request for the rest
+        result: T = await asyncio.shield(task)
+        if joined and copy_result is not None:
+            return copy_result(result)
+        return result
+
+    def _forget_inflight(self, key: Hashable, task: asyncio.Future[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the error as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
 
     async def execute(
         self,
@@ -182,17 +466,54 @@ class NationalGridClient:
             GraphQLError: When the request fails after all retries
             RetryExhaustedError: When all retry attempts are exhausted
         """
+        if not self._config.coalesce_requests or _is_mutation(request.query):
+            return await self._execute(request, headers=headers, timeout=timeout)
+        # The encoded body doubles as the coalescing key, so it is built only once
+        payload_bytes = self._encode_payload(request)
+        key = ("graphql", request.endpoint, payload_bytes, _items_key(headers), timeout)
+        return await self._single_flight(
+            key,
+            lambda: self._execute(
+                request, headers=headers, timeout=timeout, payload_bytes=payload_bytes
+            ),
+            _copy_graphql_response,
+        )
+
+    def _encode_payload(self, request: GraphQLRequest) -> bytes:
+        """Encode the request body, raising GraphQLError for unserializable variables."""
+        try:
+            return _json_encode(request.to_payload())
+        except (TypeError, ValueError) as e:
+            # orjson.JSONEncodeError is a TypeError
+            raise GraphQLError(
+                f"GraphQL request could not be encoded: {e}",
+                endpoint=request.endpoint or self._config.endpoint,
+                query=request.query,
+                variables=request.variables or None,
+                original_error=e,
+            ) from e
+
+    async def _execute(
+        self,
+        request: GraphQLRequest,
+        *,
+        headers: Mapping[str, str] | None,
+        timeout: float | None,
+        payload_bytes: bytes | None = None,
+    ) -> GraphQLResponse:
         retry_config = self._config.retry_config
         last_error: Exception | None = None
+        # Invariant across attempts; only the session and token can change on retry
+        endpoint = request.endpoint or self._config.endpoint
+        effective_timeout = self._request_timeout(timeout)
+        delay: float | None = None
+        if payload_bytes is None:
+            payload_bytes = self._encode_payload(request)
 
         for attempt in range(retry_config.max_attempts):
             try:
-                session = await self._ensure_session()
-                access_token = await self._get_access_token(session)
-                payload = request.to_payload()
-                merged_headers = self._config.build_headers(headers, access_token=access_token)
-                effective_timeout = aiohttp.ClientTimeout(total=timeout or self._config.timeout)
-                endpoint = request.endpoint or self._config.endpoint
+                session, access_token = self._ready_session() or await self._prepare_session()
+                merged_headers = self._build_headers(headers, access_token=access_token)
 
                 if attempt > 0:
                     logger.info(
@@ -201,16 +522,20 @@ class NationalGridClient:
                         attempt + 1,
                         retry_config.max_attempts,
                     )
-                else:
+                elif logger.isEnabledFor(logging.DEBUG):
                     logger.debug("POST %s", endpoint)
 
-                async with session.post(
-                    endpoint,
-                    json=payload,
-                    headers=merged_headers,
-                    timeout=effective_timeout,
-                    ssl=self._config.verify_ssl,
-                ) as response:
+                await self._throttle(endpoint)
+                async with (
+                    self._request_slot(),
+                    session.post(
+                        endpoint,
+                        data=payload_bytes,
+                        headers=merged_headers,
+                        timeout=effective_timeout,
+                        ssl=self._config.verify_ssl,
+                    ) as response,
+                ):
                     try:
                         response.raise_for_status()
                     except aiohttp.ClientResponseError as e:
@@ -218,11 +543,13 @@ class NationalGridClient:
                         if e.status == 401:
                             logger.info("Received 401, clearing cached token")
                             self._access_token = None
-                            self._token_expires_at = None
+                            self._token_valid_until = 0.0
+                        elif e.status == 429:
+                            self._pause_host(endpoint, e)
 
                         # Read response body for error context
                         try:
-                            body = await response.json(content_type=None)
+                            body = await _read_json(response)
                         except Exception:
                             body = None
 
@@ -230,13 +557,13 @@ class NationalGridClient:
                             f"GraphQL request failed with status {e.status}",
                             endpoint=endpoint,
                             query=request.query,
-                            variables=dict(request.variables) if request.variables else None,
+                            variables=request.variables or None,
                             status=e.status,
                             response_body=body,
                             original_error=e,
                         ) from e
 
-                    body = await response.json(content_type=None)
+                    body = await _read_json(response)
 
                 graphql_response = GraphQLResponse.from_payload(body)
                 if graphql_response.errors:
@@ -272,7 +599,7 @@ class NationalGridClient:
                             f"GraphQL request failed: {e}",
                             endpoint=request.endpoint or self._config.endpoint,
                             query=request.query,
-                            variables=dict(request.variables) if request.variables else None,
+                            variables=request.variables or None,
                             original_error=e,
                         ) from e
                     raise
@@ -282,7 +609,7 @@ class NationalGridClient:
                     break
 
                 # Calculate delay and retry
-                delay = self._calculate_retry_delay(attempt, retry_config)
+                delay = self._calculate_retry_delay(attempt, retry_config, e, previous_delay=delay)
                 logger.warning(
                     "Request failed (%s), retrying in %.2f seconds (attempt %d/%d)",
                     type(e).__name__,
@@ -328,21 +655,55 @@ class NationalGridClient:
             RestAPIError: When the request fails after all retries
             RetryExhaustedError: When all retry attempts are exhausted
         """
+
+        def _send() -> Coroutine[Any, Any, RestResponse]:
+            return self._request_rest(
+                method,
+                path_or_url,
+                params=params,
+                json=json,
+                data=data,
+                headers=headers,
+                timeout=timeout,
+            )
+
+        if not self._config.coalesce_requests or method.upper() != "GET":
+            return await _send()
+        key = ("rest", path_or_url, _items_key(params), _items_key(headers), timeout)
+        return await self._single_flight(key, _send, _copy_rest_response)
+
+    async def _request_rest(
+        self,
+        method: str,
+        path_or_url: str,
+        *,
+        params: Mapping[str, str] | None,
+        json: Any | None,
+        data: Any | None,
+        headers: Mapping[str, str] | None,
+        timeout: float | None,
+    ) -> RestResponse:
         retry_config = self._config.retry_config
         last_error: Exception | None = None
+        effective_timeout = self._request_timeout(timeout)
+        delay: float | None = None
 
         for attempt in range(retry_config.max_attempts):
             try:
-                session = await self._ensure_session()
-                access_token = await self._get_access_token(session)
+                session, access_token = self._ready_session() or await self._prepare_session()
+                if json is not None and data is not None:
+                    raise ValueError("data and json parameters can not be used at the same time")
                 url = self._resolve_rest_url(path_or_url)
                 content_type = "application/json" if json is not None else None
-                merged_headers = self._config.build_headers(
+                merged_headers = self._build_headers(
                     headers,
                     access_token=access_token,
                     content_type=content_type,
                 )
-                effective_timeout = aiohttp.ClientTimeout(total=timeout or self._config.timeout)
+                cache_key = self._etag_cache_key(method, url, params, headers)
+                cached = self._etag_cache.get(cache_key) if cache_key else None
+                if cached is not None:
+                    merged_headers["If-None-Match"] = cached[0]
 
                 if attempt > 0:
                     logger.info(
@@ -351,19 +712,22 @@ class NationalGridClient:
                         attempt + 1,
                         retry_config.max_attempts,
                     )
-                else:
+                elif logger.isEnabledFor(logging.DEBUG):
                     logger.debug("%s %s", method.upper(), url)
 
-                async with session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=json,
-                    data=data,
-                    headers=merged_headers,
-                    timeout=effective_timeout,
-                    ssl=self._config.verify_ssl,
-                ) as response:
+                await self._throttle(url)
+                async with (
+                    self._request_slot(),
+                    session.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        data=data if json is None else _json_encode(json),
+                        headers=merged_headers,
+                        timeout=effective_timeout,
+                        ssl=self._config.verify_ssl,
+                    ) as response,
+                ):
                     try:
                         response.raise_for_status()
                     except aiohttp.ClientResponseError as e:
@@ -371,7 +735,9 @@ class NationalGridClient:
                         if e.status == 401:
                             logger.info("Received 401, clearing cached token")
                             self._access_token = None
-                            self._token_expires_at = None
+                            self._token_valid_until = 0.0
+                        elif e.status == 429:
+                            self._pause_host(url, e)
 
                         # Read response body for error context
                         try:
@@ -388,12 +754,21 @@ class NationalGridClient:
                             original_error=e,
                         ) from e
 
+                    if response.status == 304 and cached is not None:
+                        # Unchanged since the cached copy; skip the body and the decode
+                        self._etag_cache.move_to_end(cache_key)
+                        return _copy_rest_response(cached[1])
+
                     payload = await self._read_rest_payload(response)
-                    return RestResponse(
+                    rest_response = RestResponse(
                         status=response.status,
-                        headers=dict(response.headers),
+                        headers=response.headers,
                         data=payload,
                     )
+                    etag = response.headers.get("ETag")
+                    if cache_key and etag and response.status == 200:
+                        self._store_etag(cache_key, etag, rest_response)
+                    return rest_response
 
             except Exception as e:
                 last_error = e
@@ -422,7 +797,7 @@ class NationalGridClient:
                     break
 
                 # Calculate delay and retry
-                delay = self._calculate_retry_delay(attempt, retry_config)
+                delay = self._calculate_retry_delay(attempt, retry_config, e, previous_delay=delay)
                 logger.warning(
                     "Request failed (%s), retrying in %.2f seconds (attempt %d/%d)",
                     type(e).__name__,
@@ -439,52 +814,317 @@ class NationalGridClient:
             last_error=last_error or Exception("Unknown error"),
         )
 
+    async def execute_many(
+        self,
+        requests: Sequence[GraphQLRequest],
+        *,
+        concurrency: int = 32,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> list[GraphQLResponse | BaseException]:
+        """Execute several GraphQL requests concurrently.
+
+        At most ``concurrency`` requests are in flight at once; keep it at or
+        below ``connection_limit_per_host`` so requests don't queue for a
+        connection. A failed request does not cancel the others: its exception
+        is returned in place of the response.
+
+        Args:
+            requests: GraphQL requests to execute
+            concurrency: Maximum number of simultaneous requests
+            headers: Additional headers to include in every request
+            timeout: Request timeout in seconds
+
+        Returns:
+            Responses or exceptions, in the same order as ``requests``
+        """
+        return await _gather_bounded(
+            [self.execute(request, headers=headers, timeout=timeout) for request in requests],
+            concurrency,
+        )
+
+    async def execute_batch(
+        self,
+        requests: Sequence[GraphQLRequest],
+        *,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> list[GraphQLResponse | BaseException]:
+        """Execute several GraphQL requests in a single POST when possible.
+
+        With ``enable_query_batching`` set, requests for the same endpoint are
+        sent as one JSON array of operations, costing a single round trip. If
+        batching is disabled or the requests target different endpoints, this
+        is :meth:`execute_many`. When the server rejects the batch (a 4xx
+        status or a reply that isn't a matching array), queries are re-sent one
+        by one, after backing off on a 429. A batch containing a mutation is
+        never re-sent, and neither is one that failed in a way the server may
+        have already run it (a 5xx, timeout or dropped connection); each
+        request then gets a :class:`GraphQLError` in place of its response.
+
+        Args:
+            requests: GraphQL requests to execute
+            headers: Additional headers to include
+            timeout: Request timeout in seconds
+
+        Returns:
+            Responses or exceptions, in the same order as ``requests``
+        """
+        endpoints = {request.endpoint or self._config.endpoint for request in requests}
+        if not self._config.enable_query_batching or len(requests) < 2 or len(endpoints) > 1:
+            return await self.execute_many(requests, headers=headers, timeout=timeout)
+
+        endpoint = endpoints.pop()
+        rejection: Exception
+        try:
+            return list(
+                await self._post_batch(endpoint, requests, headers=headers, timeout=timeout)
+            )
+        except aiohttp.ClientResponseError as err:
+            if err.status == 429:
+                self._pause_host(endpoint, err)
+            if not 400 <= err.status < 500:
+                return self._batch_errors(endpoint, requests, err)
+            rejection = err
+        except ValueError as err:
+            rejection = err
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            # The server may have run the batch before failing, so nothing is re-sent
+            return self._batch_errors(endpoint, requests, err)
+
+        if any(_is_mutation(request.query) for request in requests):
+            return self._batch_errors(endpoint, requests, rejection)
+        if isinstance(rejection, aiohttp.ClientResponseError) and rejection.status == 429:
+            # Nothing ran, but the host is already limiting us; wait before re-sending
+            await asyncio.sleep(
+                self._calculate_retry_delay(0, self._config.retry_config, rejection)
+            )
+        logger.debug("Batched GraphQL request rejected (%s), sending individually", rejection)
+        return await self.execute_many(requests, headers=headers, timeout=timeout)
+
+    def _batch_errors(
+        self, endpoint: str, requests: Sequence[GraphQLRequest], error: Exception
+    ) -> list[GraphQLResponse | BaseException]:
+        """Return a GraphQLError for each request of a batch that won't be re-sent."""
+        status = error.status if isinstance(error, aiohttp.ClientResponseError) else None
+        return [
+            GraphQLError(
+                f"GraphQL batch request failed: {error}",
+                endpoint=endpoint,
+                query=request.query,
+                variables=request.variables or None,
+                status=status,
+                original_error=error,
+            )
+            for request in requests
+        ]
+
+    async def _post_batch(
+        self,
+        endpoint: str,
+        requests: Sequence[GraphQLRequest],
+        *,
+        headers: Mapping[str, str] | None,
+        timeout: float | None,
+    ) -> list[GraphQLResponse]:
+        session, access_token = self._ready_session() or await self._prepare_session()
+        await self._throttle(endpoint)
+        async with (
+            self._request_slot(),
+            session.post(
+                endpoint,
+                data=_json_encode([request.to_payload() for request in requests]),
+                headers=self._build_headers(headers, access_token=access_token),
+                timeout=self._request_timeout(timeout),
+                ssl=self._config.verify_ssl,
+            ) as response,
+        ):
+            response.raise_for_status()
+            body = await _read_json(response)
+        if not isinstance(body, list) or len(body) != len(requests):
+            raise ValueError("GraphQL batch response does not match the request batch.")
+        return [GraphQLResponse.from_payload(item) for item in body]
+
+    async def request_rest_many(
+        self,
+        requests: Sequence[RestRequest],
+        *,
+        concurrency: int = 32,
+        timeout: float | None = None,
+    ) -> list[RestResponse | BaseException]:
+        """Issue several REST requests concurrently.
+
+        Behaves like :meth:`execute_many` for :class:`RestRequest` definitions.
+
+        Args:
+            requests: REST requests to issue
+            concurrency: Maximum number of simultaneous requests
+            timeout: Request timeout in seconds
+
+        Returns:
+            Responses or exceptions, in the same order as ``requests``
+        """
+        return await _gather_bounded(
+            [
+                self.request_rest(
+                    request.method,
+                    request.path_or_url,
+                    params=request.params,
+                    json=request.json,
+                    data=request.data,
+                    headers=request.headers,
+                    timeout=timeout,
+                )
+                for request in requests
+            ],
+            concurrency,
+        )
+
+    def _ready_session(self) -> tuple[aiohttp.ClientSession, str | None] | None:
+        """Return the open session and valid token without awaiting, if both are ready."""
+        session = self._session
+        if session is None or session.closed:
+            return None
+        token = self._cached_token()
+        if token is None and self._needs_auth:
+            return None
+        return session, token
+
+    async def _prepare_session(self) -> tuple[aiohttp.ClientSession, str | None]:
+        """Open the session and log in as needed (the slow path of ``_ready_session``)."""
+        session = await self._ensure_session()
+        return session, await self._get_access_token(session)
+
+    def _cached_token(self) -> str | None:
+        """Return the cached access token unless it expires within the buffer."""
+        # Monotonic, so wall-clock adjustments can't extend or cut short a token
+        if self._access_token is not None and time.monotonic() < self._token_valid_until:
+            return self._access_token
+        return None
+
     async def _get_access_token(self, session: aiohttp.ClientSession) -> str | None:
-        # Check if we have a valid cached token
-        if self._access_token and self._token_expires_at:
-            # Add buffer time to refresh before actual expiration
-            if time.time() < (self._token_expires_at - TOKEN_EXPIRY_BUFFER_SECONDS):
-                return self._access_token
+        if not self._needs_auth:
+            return None
+        token = self._cached_token()
+        if token:
+            return token
+        if self._access_token:
             logger.debug("Access token expired or expiring soon, refreshing")
 
-        if not (self._config.username and self._config.password):
+        username, password = self._config.username, self._config.password
+        if not (username and password):
             return None
 
-        async with self._auth_lock:
-            # Double-check after acquiring lock
-            if self._access_token and self._token_expires_at:
-                if time.time() < (self._token_expires_at - TOKEN_EXPIRY_BUFFER_SECONDS):
-                    return self._access_token
-
-            auth_client = NationalGridAuth()
-            token, expires_in = await auth_client.async_login(
-                session,
-                self._config.username,
-                self._config.password,
+        # Concurrent callers share one login instead of queueing behind a lock;
+        # the first caller being cancelled doesn't abort it for the others
+        return await self._single_flight(
+            _LOGIN_KEY, lambda: self._login(session, username, password)
+        )
+
+    async def _login(
+        self, session: aiohttp.ClientSession, username: str, password: str
+    ) -> str | None:
+        async with self._login_session(session) as login_session:
+            token, expires_in = await self._auth.async_login(
+                login_session,
+                username,
+                password,
                 self._login_data,
                 timeout=self._config.timeout,
             )
-            if token and expires_in:
-                self._access_token = token
-                self._token_expires_at = time.time() + expires_in
-                logger.debug("Access token refreshed, expires in %d seconds", expires_in)
-            else:
-                self._access_token = None
-                self._token_expires_at = None
-
+        if token and expires_in:
+            self._access_token = token
+            self._token_valid_until = time.monotonic() + expires_in - TOKEN_EXPIRY_BUFFER_SECONDS
+            logger.debug("Access token refreshed, expires in %d seconds", expires_in)
+            refresh_in = expires_in - TOKEN_EXPIRY_BUFFER_SECONDS - BACKGROUND_REFRESH_LEAD_SECONDS
+            # A token too short-lived to refresh ahead of time would make every
+            # login schedule another one at once; requests log in on demand instead
+            if self._config.refresh_token_in_background and refresh_in > 0:
+                self._schedule_token_refresh(refresh_in)
+        else:
+            self._access_token = None
+            self._token_valid_until = 0.0
         return self._access_token
 
+    def _schedule_token_refresh(self, delay: float) -> None:
+        """Log in again in the background ``delay`` seconds from now."""
+        # Replaces a refresh that is still sleeping; one that has woken up has
+        # already detached itself in _refresh_token_later
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        self._refresh_task = asyncio.create_task(self._refresh_token_later(delay))
+
+    async def _refresh_token_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        # The login below runs in its own task and schedules the next refresh,
+        # which must not cancel this one while it waits for the result
+        self._refresh_task = None
+        session = self._session
+        username, password = self._config.username, self._config.password
+        if session is None or session.closed or not (username and password):
+            return
+        try:
+            await self._single_flight(_LOGIN_KEY, lambda: self._login(session, username, password))
+        except Exception:
+            # Not fatal: the next request logs in on demand once the token expires
+            logger.warning("Background token refresh failed", exc_info=True)
+
+    def _etag_cache_key(
+        self,
+        method: str,
+        url: str,
+        params: Mapping[str, str] | None,
+        headers: Mapping[str, str] | None,
+    ) -> tuple[str, tuple[tuple[str, str], ...], tuple[tuple[str, str], ...]] | None:
+        """Return the ETag cache key for a request, or ``None`` if it isn't cacheable."""
+        if not self._config.etag_cache_size or method.upper() != "GET":
+            return None
+        # Callers can force a full fetch by sending Cache-Control: no-cache
+        if headers and any(
+            name.lower() == "cache-control" and "no-cache" in value.lower()
+            for name, value in headers.items()
+        ):
+            return None
+        # Headers such as Accept can select a different representation of the URL
+        return url, _items_key(params), _items_key(headers)
+
+    def _store_etag(self, key: Hashable, etag: str, response: RestResponse) -> None:
+        # Cache a copy, so the caller mutating its response can't change later hits
+        self._etag_cache[key] = (etag, _copy_rest_response(response))
+        self._etag_cache.move_to_end(key)
+        while len(self._etag_cache) > self._config.etag_cache_size:
+            self._etag_cache.popitem(last=False)
+
+    def _login_session(
+        self, session: aiohttp.ClientSession
+    ) -> contextlib.AbstractAsyncContextManager[aiohttp.ClientSession]:
+        """Return the session the OIDC login should run on.
+
+        The client-owned session does not keep cookies, so the login gets a
+        short-lived session with a B2C cookie jar that borrows the same
+        connection pool. A caller-provided session is used as-is.
+        """
+        if not self._owns_session:
+            return contextlib.nullcontext(session)
+        return aiohttp.ClientSession(
+            connector=session.connector,
+            connector_owner=False,
+            cookie_jar=create_cookie_jar(),
+            timeout=session.timeout,
+        )
+
     def _resolve_rest_url(self, path_or_url: str) -> str:
-        if path_or_url.startswith("http://") or path_or_url.startswith("https://"):
+        if path_or_url.startswith(("http://", "https://")):
             return path_or_url
-        if not self._config.rest_base_url:
+        if not self._rest_base_prefix:
             raise ValueError("rest_base_url is required for relative REST paths.")
-        return urljoin(self._config.rest_base_url.rstrip("/") + "/", path_or_url.lstrip("/"))
+        return self._rest_base_prefix + path_or_url.lstrip("/")
 
     async def _read_rest_payload(self, response: aiohttp.ClientResponse) -> Any:
         try:
-            return await response.json(content_type=None)
-        except aiohttp.ContentTypeError:
+            return await _read_json(response)
+        except ValueError:
+            # Not JSON; the body is already buffered, so text() doesn't re-read it
             return await response.text()
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
@@ -498,16 +1138,22 @@ class NationalGridClient:
             if self._session and not self._session.closed:
                 return self._session
 
-            timeout = aiohttp.ClientTimeout(total=self._config.timeout)
             # Create connector with configured limits
             connector = aiohttp.TCPConnector(
                 limit=self._config.connection_limit,
                 limit_per_host=self._config.connection_limit_per_host,
                 ttl_dns_cache=self._config.dns_cache_ttl,
+                keepalive_timeout=self._config.keepalive_timeout,
+                # No explicit resolver: aiohttp's default already uses aiodns when
+                # it is importable, and closes the resolver it created with the session
             )
             self._session = aiohttp.ClientSession(
-                timeout=timeout,
+                timeout=self._default_timeout,
                 connector=connector,
+                # API calls are token-authenticated; only the OIDC login needs
+                # cookies, and it gets its own jar (see _login_session)
+                cookie_jar=aiohttp.DummyCookieJar(),
+                # No json_serialize: every request body is pre-encoded with _json_encode
             )
             return self._session
 
@@ -535,8 +1181,8 @@ class NationalGridClient:
             DataExtractionError: When the expected data path is missing
             ValueError: When the response contains GraphQL errors
         """
-        session = await self._ensure_session()
-        await self._get_access_token(session)
+        if self._ready_session() is None:
+            await self._prepare_session()
         variables: Mapping[str, Any] | None = None
         sub_value = self._login_data.get("sub")
         if sub_value:
@@ -613,9 +1259,10 @@ class NationalGridClient:
     async def get_energy_usages(
         self,
         account_number: str,
-        from_month: int,
+        from_month: int | None = None,
         first: int = 12,
         *,
+        months_back: int = 12,
         headers: Mapping[str, str] | None = None,
         timeout: float | None = None,
     ) -> list[EnergyUsage]:
@@ -623,8 +1270,10 @@ class NationalGridClient:
 
         Args:
             account_number: The billing account number
-            from_month: Start month in YYYYMM format (e.g., 202401)
+            from_month: Start month in YYYYMM format (e.g., 202401). Defaults to
+                ``months_back`` months before the current month.
             first: Number of records to fetch (default 12)
+            months_back: Months to look back when ``from_month`` is not given (default 12)
             headers: Additional headers to include
             timeout: Request timeout in seconds
 
@@ -636,6 +1285,8 @@ class NationalGridClient:
             DataExtractionError: When the expected data path is missing
             ValueError: When the response contains GraphQL errors
         """
+        if from_month is None:
+            from_month = _year_month_back(date.today(), months_back)
         request = energy_usages_request(
             variables={
                 "accountNumber": account_number,
@@ -646,6 +1297,57 @@ class NationalGridClient:
         response = await self.execute(request, headers=headers, timeout=timeout)
         return extract_energy_usages(response)
 
+    async def get_energy_usage_summary(
+        self,
+        account_number: str,
+        query_date: date | str,
+        company_code: str,
+        from_month: int | None = None,
+        first: int = 12,
+        *,
+        months_back: int = 12,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> tuple[list[EnergyUsage], list[EnergyUsageCost]]:
+        """Get energy usages and energy usage costs in a single request.
+
+        Equivalent to :meth:`get_energy_usages` plus :meth:`get_energy_usage_costs`,
+        but both are fetched in one GraphQL round trip.
+
+        Args:
+            account_number: The billing account number
+            query_date: Date for the costs query (date object or ISO string YYYY-MM-DD)
+            company_code: Company code value (e.g., "NECO", "KEDNE")
+            from_month: Start month in YYYYMM format (e.g., 202401). Defaults to
+                ``months_back`` months before the current month.
+            first: Number of usage records to fetch (default 12)
+            months_back: Months to look back when ``from_month`` is not given (default 12)
+            headers: Additional headers to include
+            timeout: Request timeout in seconds
+
+        Returns:
+            Tuple of (energy usages, energy usage costs)
+
+        Raises:
+            GraphQLError: When the GraphQL request fails
+            DataExtractionError: When the expected data path is missing
+            ValueError: When the response contains GraphQL errors
+        """
+        if from_month is None:
+            from_month = _year_month_back(date.today(), months_back)
+        date_str = query_date.isoformat() if isinstance(query_date, date) else query_date
+        request = energy_usage_summary_request(
+            variables={
+                "accountNumber": account_number,
+                "from": from_month,
+                "first": first,
+                "date": date_str,
+                "companyCode": company_code,
+            },
+        )
+        response = await self.execute(request, headers=headers, timeout=timeout)
+        return extract_energy_usages(response), extract_energy_usage_costs(response)
+
     async def get_ami_energy_usages(
         self,
         meter_number: str,
@@ -722,7 +1424,9 @@ class NationalGridClient:
         service_point_str = str(service_point_number)
 
         if isinstance(start_datetime, datetime):
-            datetime_str = start_datetime.strftime("%Y-%m-%d %H:%M:%S")
+            # Same "YYYY-MM-DD HH:MM:SS" output as strftime without the format parsing;
+            # drop tzinfo and sub-second precision, which the endpoint does not accept
+            datetime_str = start_datetime.replace(tzinfo=None).isoformat(" ", "seconds")
         else:
             datetime_str = start_datetime
 
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import importlib.util
 from collections.abc import Mapping
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, replace
+from typing import Literal
 
 DEFAULT_ENDPOINT = "https://myaccount.nationalgrid.com/api/user-cu-uwp-gql"
 DEFAULT_TIMEOUT = 30.0
 
+# The GraphQL responses are verbose JSON that compresses well. Only advertise
+# brotli when a decoder is installed, otherwise aiohttp could not read the body.
+ACCEPT_ENCODING = "gzip, deflate"
+if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+    ACCEPT_ENCODING = "br, " + ACCEPT_ENCODING
+
 
 @dataclass(slots=True)
 class RetryConfig:
@@ -20,6 +28,9 @@ class RetryConfig:
     retry_on_status: tuple[int, ...] = (408, 429, 500, 502, 503, 504)  # HTTP statuses to retry
     retry_on_connection_errors: bool = True  # Retry on connection errors
     retry_on_timeout: bool = True  # Retry on timeout errors
+    # How backoff delays are randomised: "full" draws from [0, backoff], "decorrelated"
+    # grows from the previous delay, "symmetric" varies the backoff by ±25%
+    jitter_mode: Literal["full", "decorrelated", "symmetric"] = "full"
 
 
 @dataclass(slots=True)
@@ -39,6 +50,22 @@ class NationalGridConfig:
     connection_limit: int = 100  # Total connection pool size
     connection_limit_per_host: int = 30  # Connections per individual host
     dns_cache_ttl: int = 300  # DNS cache TTL in seconds
+    keepalive_timeout: float = 75.0  # Seconds to keep idle connections open for reuse
+    # Maximum number of in-flight API requests per client (None disables the limit)
+    max_concurrent_requests: int | None = None
+    # Let concurrent identical GraphQL queries and REST GETs share one request;
+    # each caller still gets its own copy of the response
+    coalesce_requests: bool = False
+    # REST GET responses kept for ETag revalidation (0 disables the cache)
+    etag_cache_size: int = 64
+    # Send execute_batch() requests as one array POST (the server must support it)
+    enable_query_batching: bool = False
+    # Pace requests per host (None disables pacing); bursts of up to rate_limit_burst
+    requests_per_second: float | None = None
+    rate_limit_burst: int = 5
+    # Renew the access token in a background task shortly before it expires, so
+    # requests never wait on a login after the first one (call close() to stop it)
+    refresh_token_in_background: bool = False
 
     def build_headers(
         self,
@@ -51,6 +78,7 @@ class NationalGridConfig:
 
         headers: dict[str, str] = {
             "Accept": "application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
         }
         if content_type:
             headers["Content-Type"] = content_type
@@ -65,7 +93,5 @@ class NationalGridConfig:
 
     def with_overrides(self, **overrides: object) -> NationalGridConfig:
         """Return a cloned config with updated fields."""
-
-        data = asdict(self)
-        data.update(overrides)
-        return NationalGridConfig(**data)
+        # Shallow copy: asdict() would deep-copy every field and turn retry_config into a dict
+        return replace(self, **overrides)  # type: ignore[arg-type]
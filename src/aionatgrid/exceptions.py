@@ -2,8 +2,19 @@
 
 from __future__ import annotations
 
+import reprlib
+from collections.abc import Mapping
 from typing import Any
 
+# Bounded repr for response data in error messages: containers are cut off
+# while formatting, rather than rendering the whole response and slicing it
+_response_repr = reprlib.Repr()
+_response_repr.maxlevel = 3
+_response_repr.maxdict = 4
+_response_repr.maxlist = 4
+_response_repr.maxstring = 100
+_response_repr.maxother = 100
+
 
 class CannotConnectError(Exception):
     """Error to indicate we cannot connect."""
@@ -16,16 +27,35 @@ class InvalidAuthError(Exception):
 class NationalGridError(Exception):
     """Base exception for National Grid API errors."""
 
+    # Slots keep the context attributes out of a per-instance __dict__, which
+    # adds up when a retry storm raises many errors
+    __slots__ = ()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle via ``__new__`` and the slot values.
+
+        ``BaseException.__reduce__`` would call ``cls(*args)``, which the
+        subclasses' required context arguments reject, and only saves ``__dict__``.
+        """
+        state = dict(self.__dict__)
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return (type(self).__new__, (type(self), *self.args), state)
+
 
 class GraphQLError(NationalGridError):
     """Raised when GraphQL request fails."""
 
+    __slots__ = ("endpoint", "original_error", "query", "response_body", "status", "variables")
+
     def __init__(
         self,
         message: str,
         endpoint: str,
         query: str | None = None,
-        variables: dict[str, Any] | None = None,
+        variables: Mapping[str, Any] | None = None,
         status: int | None = None,
         response_body: dict[str, Any] | None = None,
         original_error: Exception | None = None,
@@ -36,7 +66,7 @@ class GraphQLError(NationalGridError):
             message: Human-readable error message
             endpoint: GraphQL endpoint URL
             query: GraphQL query that failed (optional)
-            variables: Query variables (optional)
+            variables: Query variables, kept by reference (optional)
             status: HTTP status code (optional)
             response_body: Response body if available (optional)
             original_error: Original exception that caused this (optional)
@@ -69,6 +99,8 @@ class GraphQLError(NationalGridError):
 class RestAPIError(NationalGridError):
     """Raised when REST API request fails."""
 
+    __slots__ = ("method", "original_error", "response_text", "status", "url")
+
     def __init__(
         self,
         message: str,
@@ -117,6 +149,8 @@ class RestAPIError(NationalGridError):
 class RetryExhaustedError(NationalGridError):
     """Raised when all retry attempts are exhausted."""
 
+    __slots__ = ("attempts", "last_error")
+
     def __init__(
         self,
         message: str,
@@ -144,6 +178,8 @@ class RetryExhaustedError(NationalGridError):
 class DataExtractionError(NationalGridError):
     """Raised when expected data cannot be extracted from a response."""
 
+    __slots__ = ("path", "response_data")
+
     def __init__(
         self,
         message: str,
@@ -166,7 +202,5 @@ class DataExtractionError(NationalGridError):
         parts = [super().__str__()]
         parts.append(f"Path: {self.path}")
         if self.response_data is not None:
-            data_str = str(self.response_data)
-            data_preview = data_str[:200] + "..." if len(data_str) > 200 else data_str
-            parts.append(f"Response data: {data_preview}")
+            parts.append(f"Response data: {_response_repr.repr(self.response_data)}")
         return "\n".join(parts)
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import cast
+from collections.abc import Mapping
+from typing import Any, cast
 
 from .exceptions import DataExtractionError
 from .graphql import GraphQLResponse
@@ -17,18 +18,13 @@ from .models import (
 from .rest import RestResponse
 
 
-def extract_linked_accounts(response: GraphQLResponse) -> list[AccountLink]:
-    """Extract linked accounts from a GraphQL response.
-
-    Args:
-        response: The GraphQL response from a linked billing accounts query
-
-    Returns:
-        List of account links
+def _extract_path(response: GraphQLResponse, *keys: str) -> Any:
+    """Return the value at ``data.<keys...>`` of a GraphQL response.
 
     Raises:
         ValueError: If the response contains GraphQL errors
-        DataExtractionError: If the expected data path is missing
+        DataExtractionError: If the data or any field along the path is missing,
+            or a field along the path is not an object
     """
     response.raise_on_errors()
 
@@ -39,31 +35,51 @@ def extract_linked_accounts(response: GraphQLResponse) -> list[AccountLink]:
             response_data=None,
         )
 
-    user = response.data.get("user")
-    if user is None:
-        raise DataExtractionError(
-            "Missing 'user' field in response",
-            path="data.user",
-            response_data=response.data,
-        )
+    # Fast path: plain subscripts, with no per-level None checks when the data is there
+    value: Any = response.data
+    try:
+        for key in keys:
+            value = value[key]
+    except (KeyError, TypeError):
+        value = None
+    if value is not None:
+        return value
+
+    # Slow path: walk again to report the first missing field
+    value = response.data
+    parent = "response"
+    for depth, key in enumerate(keys):
+        if not isinstance(value, Mapping):
+            raise DataExtractionError(
+                f"Expected an object for {parent}, got {type(value).__name__}",
+                path=".".join(("data", *keys[:depth])),
+                response_data=response.data,
+            )
+        value = value.get(key)
+        if value is None:
+            raise DataExtractionError(
+                f"Missing '{key}' field in {parent}",
+                path=".".join(("data", *keys[: depth + 1])),
+                response_data=response.data,
+            )
+        parent = key
+    return value
 
-    account_links = user.get("accountLinks")
-    if account_links is None:
-        raise DataExtractionError(
-            "Missing 'accountLinks' field in response",
-            path="data.user.accountLinks",
-            response_data=response.data,
-        )
 
-    nodes = account_links.get("nodes")
-    if nodes is None:
-        raise DataExtractionError(
-            "Missing 'nodes' field in accountLinks",
-            path="data.user.accountLinks.nodes",
-            response_data=response.data,
-        )
+def extract_linked_accounts(response: GraphQLResponse) -> list[AccountLink]:
+    """Extract linked accounts from a GraphQL response.
 
-    return cast(list[AccountLink], nodes)
+    Args:
+        response: The GraphQL response from a linked billing accounts query
+
+    Returns:
+        List of account links
+
+    Raises:
+        ValueError: If the response contains GraphQL errors
+        DataExtractionError: If the expected data path is missing
+    """
+    return cast(list[AccountLink], _extract_path(response, "user", "accountLinks", "nodes"))
 
 
 def extract_billing_account(response: GraphQLResponse) -> BillingAccount:
@@ -79,24 +95,7 @@ def extract_billing_account(response: GraphQLResponse) -> BillingAccount:
         ValueError: If the response contains GraphQL errors
         DataExtractionError: If the expected data path is missing
     """
-    response.raise_on_errors()
-
-    if response.data is None:
-        raise DataExtractionError(
-            "Response data is null",
-            path="data",
-            response_data=None,
-        )
-
-    billing_account = response.data.get("billingAccount")
-    if billing_account is None:
-        raise DataExtractionError(
-            "Missing 'billingAccount' field in response",
-            path="data.billingAccount",
-            response_data=response.data,
-        )
-
-    return cast(BillingAccount, billing_account)
+    return cast(BillingAccount, _extract_path(response, "billingAccount"))
 
 
 def extract_energy_usage_costs(response: GraphQLResponse) -> list[EnergyUsageCost]:
@@ -112,32 +111,7 @@ def extract_energy_usage_costs(response: GraphQLResponse) -> list[EnergyUsageCos
         ValueError: If the response contains GraphQL errors
         DataExtractionError: If the expected data path is missing
     """
-    response.raise_on_errors()
-
-    if response.data is None:
-        raise DataExtractionError(
-            "Response data is null",
-            path="data",
-            response_data=None,
-        )
-
-    energy_usage_costs = response.data.get("energyUsageCosts")
-    if energy_usage_costs is None:
-        raise DataExtractionError(
-            "Missing 'energyUsageCosts' field in response",
-            path="data.energyUsageCosts",
-            response_data=response.data,
-        )
-
-    nodes = energy_usage_costs.get("nodes")
-    if nodes is None:
-        raise DataExtractionError(
-            "Missing 'nodes' field in energyUsageCosts",
-            path="data.energyUsageCosts.nodes",
-            response_data=response.data,
-        )
-
-    return cast(list[EnergyUsageCost], nodes)
+    return cast(list[EnergyUsageCost], _extract_path(response, "energyUsageCosts", "nodes"))
 
 
 def extract_energy_usages(response: GraphQLResponse) -> list[EnergyUsage]:
@@ -153,32 +127,7 @@ def extract_energy_usages(response: GraphQLResponse) -> list[EnergyUsage]:
         ValueError: If the response contains GraphQL errors
         DataExtractionError: If the expected data path is missing
     """
-    response.raise_on_errors()
-
-    if response.data is None:
-        raise DataExtractionError(
-            "Response data is null",
-            path="data",
-            response_data=None,
-        )
-
-    energy_usages = response.data.get("energyUsages")
-    if energy_usages is None:
-        raise DataExtractionError(
-            "Missing 'energyUsages' field in response",
-            path="data.energyUsages",
-            response_data=response.data,
-        )
-
-    nodes = energy_usages.get("nodes")
-    if nodes is None:
-        raise DataExtractionError(
-            "Missing 'nodes' field in energyUsages",
-            path="data.energyUsages.nodes",
-            response_data=response.data,
-        )
-
-    return cast(list[EnergyUsage], nodes)
+    return cast(list[EnergyUsage], _extract_path(response, "energyUsages", "nodes"))
 
 
 def extract_ami_energy_usages(response: GraphQLResponse) -> list[AmiEnergyUsage]:
@@ -194,32 +143,7 @@ def extract_ami_energy_usages(response: GraphQLResponse) -> list[AmiEnergyUsage]
         ValueError: If the response contains GraphQL errors
         DataExtractionError: If the expected data path is missing
     """
-    response.raise_on_errors()
-
-    if response.data is None:
-        raise DataExtractionError(
-            "Response data is null",
-            path="data",
-            response_data=None,
-        )
-
-    ami_energy_usages = response.data.get("amiEnergyUsages")
-    if ami_energy_usages is None:
-        raise DataExtractionError(
-            "Missing 'amiEnergyUsages' field in response",
-            path="data.amiEnergyUsages",
-            response_data=response.data,
-        )
-
-    nodes = ami_energy_usages.get("nodes")
-    if nodes is None:
-        raise DataExtractionError(
-            "Missing 'nodes' field in amiEnergyUsages",
-            path="data.amiEnergyUsages.nodes",
-            response_data=response.data,
-        )
-
-    return cast(list[AmiEnergyUsage], nodes)
+    return cast(list[AmiEnergyUsage], _extract_path(response, "amiEnergyUsages", "nodes"))
 
 
 def extract_interval_reads(response: RestResponse) -> list[IntervalRead]:
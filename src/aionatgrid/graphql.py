@@ -4,10 +4,18 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from textwrap import dedent
 from typing import Any
 
 
+@lru_cache(maxsize=128)
+def _normalize_query(query: str) -> str:
+    # Requests are rebuilt per call from a handful of query strings, so cache
+    # the dedent (a regex pass over the whole query) instead of redoing it
+    return dedent(query).strip()
+
+
 @dataclass(slots=True)
 class GraphQLRequest:
     """A reusable GraphQL request payload."""
@@ -18,7 +26,7 @@ class GraphQLRequest:
     endpoint: str | None = None
 
     def to_payload(self) -> dict[str, Any]:
-        payload: dict[str, Any] = {"query": dedent(self.query).strip()}
+        payload: dict[str, Any] = {"query": _normalize_query(self.query)}
         if self.variables:
             payload["variables"] = dict(self.variables)
         if self.operation_name:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from textwrap import dedent, indent
 from typing import Any
 
@@ -66,6 +67,25 @@ nodes {
     usageYearMonth
 }
 """
+ENERGY_USAGE_COSTS_VARIABLE_DEFINITIONS = (
+    "$accountNumber: String!",
+    "$date: Date!",
+    "$companyCode: CompanyCodeValue!",
+)
+ENERGY_USAGE_COSTS_FIELD_ARGUMENTS = (
+    "accountNumber: $accountNumber, date: $date, companyCode: $companyCode"
+)
+ENERGY_USAGES_VARIABLE_DEFINITIONS = (
+    "$accountNumber: String!",
+    "$from: Int!",
+    "$first: Int!",
+)
+ENERGY_USAGES_FIELD_ARGUMENTS = (
+    "accountNumber: $accountNumber, "
+    "where: {usageYearMonth: {gte: $from}}, "
+    "order: [{usageYearMonth: DESC}], "
+    "first: $first"
+)
 AMI_ENERGY_USAGES_SELECTION_SET = """
 nodes {
     date
@@ -90,24 +110,42 @@ class StandardQuery:
     def to_request(self) -> GraphQLRequest:
         """Convert this query definition into a `GraphQLRequest`."""
 
-        selection_set = dedent(self.selection_set).strip() or DEFAULT_SELECTION_SET
+        query = self._render_query(
+            self.operation_name,
+            self.root_field,
+            self.selection_set,
+            _normalize_variable_definitions(self.variable_definitions),
+            self.field_arguments,
+        )
+        return GraphQLRequest(
+            query=query,
+            variables=self.variables,
+            operation_name=self.operation_name,
+            endpoint=self.endpoint,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _render_query(
+        operation_name: str,
+        root_field: str,
+        selection_set: str,
+        variable_definitions: str | None,
+        field_arguments: str | None,
+    ) -> str:
+        # The query text depends only on these strings, so each distinct query is
+        # rendered once and reused by every later request.
+        selection_set = dedent(selection_set).strip() or DEFAULT_SELECTION_SET
         selection_block = indent(selection_set, "  ")
-        field_args = f"({self.field_arguments})" if self.field_arguments else ""
+        field_args = f"({field_arguments})" if field_arguments else ""
         selection = dedent(
             f"""
-            {self.root_field}{field_args} {{
+            {root_field}{field_args} {{
             {selection_block}
             }}
             """
         ).strip()
-        variable_definitions = _normalize_variable_definitions(self.variable_definitions)
-        query = compose_query(self.operation_name, selection, variables=variable_definitions)
-        return GraphQLRequest(
-            query=query,
-            variables=self.variables,
-            operation_name=self.operation_name,
-            endpoint=self.endpoint,
-        )
+        return compose_query(operation_name, selection, variables=variable_definitions)
 
 
 def linked_billing_accounts_request(
@@ -162,14 +200,8 @@ def energy_usage_costs_request(
     *,
     selection_set: str = ENERGY_USAGE_COSTS_SELECTION_SET,
     variables: Mapping[str, Any] | None = None,
-    variable_definitions: str | Sequence[str] | None = (
-        "$accountNumber: String!",
-        "$date: Date!",
-        "$companyCode: CompanyCodeValue!",
-    ),
-    field_arguments: str | None = (
-        "accountNumber: $accountNumber, date: $date, companyCode: $companyCode"
-    ),
+    variable_definitions: str | Sequence[str] | None = ENERGY_USAGE_COSTS_VARIABLE_DEFINITIONS,
+    field_arguments: str | None = ENERGY_USAGE_COSTS_FIELD_ARGUMENTS,
     operation_name: str = "EnergyUsageCosts",
 ) -> GraphQLRequest:
     """Build an energy usage costs query.
@@ -191,17 +223,8 @@ def energy_usages_request(
     *,
     selection_set: str = ENERGY_USAGES_SELECTION_SET,
     variables: Mapping[str, Any] | None = None,
-    variable_definitions: str | Sequence[str] | None = (
-        "$accountNumber: String!",
-        "$from: Int!",
-        "$first: Int!",
-    ),
-    field_arguments: str | None = (
-        "accountNumber: $accountNumber, "
-        "where: {usageYearMonth: {gte: $from}}, "
-        "order: [{usageYearMonth: DESC}], "
-        "first: $first"
-    ),
+    variable_definitions: str | Sequence[str] | None = ENERGY_USAGES_VARIABLE_DEFINITIONS,
+    field_arguments: str | None = ENERGY_USAGES_FIELD_ARGUMENTS,
     operation_name: str = "EnergyUsages",
 ) -> GraphQLRequest:
     """Build an energy usages query.
@@ -219,6 +242,50 @@ def energy_usages_request(
     ).to_request()
 
 
+def energy_usage_summary_request(
+    *,
+    variables: Mapping[str, Any] | None = None,
+    operation_name: str = "EnergyUsageSummary",
+) -> GraphQLRequest:
+    """Build one query for both energy usages and energy usage costs.
+
+    Both fields are served by the energyusage-cu-uwp-gql GraphQL endpoint, so
+    this fetches in one request what `energy_usages_request` and
+    `energy_usage_costs_request` fetch in two. The variables are the union of
+    theirs, and the response works with both of their extractors.
+    """
+    return GraphQLRequest(
+        query=_render_energy_usage_summary(operation_name),
+        variables=variables,
+        operation_name=operation_name,
+        endpoint=ENERGY_USAGE_ENDPOINT,
+    )
+
+
+@lru_cache(maxsize=8)
+def _render_energy_usage_summary(operation_name: str) -> str:
+    fields = "\n".join(
+        f"{root_field}({field_arguments}) {{\n{indent(dedent(selection_set).strip(), '  ')}\n}}"
+        for root_field, field_arguments, selection_set in (
+            ("energyUsages", ENERGY_USAGES_FIELD_ARGUMENTS, ENERGY_USAGES_SELECTION_SET),
+            (
+                "energyUsageCosts",
+                ENERGY_USAGE_COSTS_FIELD_ARGUMENTS,
+                ENERGY_USAGE_COSTS_SELECTION_SET,
+            ),
+        )
+    )
+    # accountNumber is shared by both fields, so declare each variable once
+    variable_definitions = dict.fromkeys(
+        ENERGY_USAGES_VARIABLE_DEFINITIONS + ENERGY_USAGE_COSTS_VARIABLE_DEFINITIONS
+    )
+    return compose_query(
+        operation_name,
+        fields,
+        variables=_normalize_variable_definitions(list(variable_definitions)),
+    )
+
+
 def ami_energy_usages_request(
     *,
     selection_set: str = AMI_ENERGY_USAGES_SELECTION_SET,
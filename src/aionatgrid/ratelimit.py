@@ -0,0 +1,50 @@
+"""Client-side request pacing for the National Grid API."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Token bucket that paces requests to ``rate`` per second with bursts of ``burst``.
+
+    ``pause`` holds every caller back until a deadline, e.g. the ``Retry-After``
+    delay from a 429 response, so waiting requests don't all hit the limit again.
+    """
+
+    __slots__ = ("_burst", "_lock", "_rate", "_resume_at", "_tokens", "_updated_at")
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        if burst < 1:
+            raise ValueError("burst must be at least 1.")
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent, then consume a token."""
+        # Callers queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._resume_at:
+                    await asyncio.sleep(self._resume_at - now)
+                    continue
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._updated_at) * self._rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all requests for ``seconds`` from now."""
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
@@ -9,7 +9,11 @@ from typing import Any
 
 @dataclass(slots=True)
 class RestResponse:
-    """Normalized REST response envelope."""
+    """Normalized REST response envelope.
+
+    ``headers`` is the response's read-only, case-insensitive header mapping;
+    copy it with ``dict()`` if you need to modify it.
+    """
 
     status: int
     headers: Mapping[str, str]
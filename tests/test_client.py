@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import weakref
+from collections.abc import Callable, Sequence
+from typing import NamedTuple
 from unittest.mock import MagicMock
 
 import aiohttp
 import pytest
 
 from aionatgrid.client import NationalGridClient
-from aionatgrid.config import NationalGridConfig
-from aionatgrid.graphql import GraphQLRequest
+from aionatgrid.config import NationalGridConfig, RetryConfig
+from aionatgrid.exceptions import GraphQLError, RetryExhaustedError
+from aionatgrid.graphql import GraphQLRequest, GraphQLResponse
 from aionatgrid.oidchelper import LoginData
 
 
@@ -22,8 +28,8 @@ class _DummyResponse:
     async def __aexit__(self, exc_type, exc, tb) -> bool:  # type: ignore[override]
         return False
 
-    async def json(self, content_type: str | None = None) -> dict[str, object]:
-        return self._payload
+    async def read(self) -> bytes:
+        return json.dumps(self._payload).encode()
 
     def raise_for_status(self) -> None:
         return None
@@ -41,8 +47,8 @@ class _DummyRestResponse:
     async def __aexit__(self, exc_type, exc, tb) -> bool:  # type: ignore[override]
         return False
 
-    async def json(self, content_type: str | None = None) -> object:
-        return self._payload
+    async def read(self) -> bytes:
+        return json.dumps(self._payload).encode()
 
     async def text(self) -> str:
         return "ok"
@@ -51,6 +57,50 @@ class _DummyRestResponse:
         return None
 
 
+class _LoginCall(NamedTuple):
+    session: aiohttp.ClientSession
+    connector: aiohttp.BaseConnector | None
+    username: str
+    password: str
+
+
+class _FakeLogin:
+    """Stand-in for ``NationalGridAuth.async_login`` handing out tokens in order.
+
+    The last token repeats once the others are used up.
+    """
+
+    def __init__(self, tokens: Sequence[tuple[str, int]], delay: float) -> None:
+        self._tokens = tokens
+        self._delay = delay
+        self.calls: list[_LoginCall] = []
+
+    async def __call__(
+        self,
+        session: aiohttp.ClientSession,
+        username: str,
+        password: str,
+        login_data: LoginData,
+        timeout: float = 30.0,
+    ) -> tuple[str, int]:
+        self.calls.append(_LoginCall(session, session.connector, username, password))
+        if self._delay:
+            await asyncio.sleep(self._delay)
+        return self._tokens[min(len(self.calls), len(self._tokens)) - 1]
+
+
+@pytest.fixture
+def fake_login(monkeypatch: pytest.MonkeyPatch) -> Callable[..., _FakeLogin]:
+    """Patch the OIDC login; call with ``(token, expires_in)`` pairs to install it."""
+
+    def _install(*tokens: tuple[str, int], delay: float = 0.0) -> _FakeLogin:
+        login = _FakeLogin(tokens or [("token", 3600)], delay)
+        monkeypatch.setattr("aionatgrid.client.NationalGridAuth.async_login", login)
+        return login
+
+    return _install
+
+
 @pytest.mark.asyncio
 async def test_execute_returns_response_payload() -> None:
     config = NationalGridConfig(endpoint="https://example.test/graphql")
@@ -85,11 +135,11 @@ async def test_execute_uses_request_endpoint() -> None:
 
     args, kwargs = session.post.call_args
     assert args[0] == "https://example.test/override"
-    assert kwargs["json"]["query"] == "query Test { value }"
+    assert json.loads(kwargs["data"])["query"] == "query Test { value }"
 
 
 @pytest.mark.asyncio
-async def test_execute_merges_headers(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_execute_merges_headers(fake_login: Callable[..., _FakeLogin]) -> None:
     config = NationalGridConfig(
         endpoint="https://example.test/graphql",
         username="user@example.com",
@@ -100,19 +150,7 @@ async def test_execute_merges_headers(monkeypatch: pytest.MonkeyPatch) -> None:
     session.closed = False
     session.post.return_value = _DummyResponse({"data": {}})
 
-    async def _fake_login(
-        self,
-        session: aiohttp.ClientSession,
-        username: str,
-        password: str,
-        login_data: LoginData,
-        timeout: float,
-    ) -> tuple[str, int]:
-        assert username == "user@example.com"
-        assert password == "super-secret"
-        return "token", 3600
-
-    monkeypatch.setattr("aionatgrid.client.NationalGridAuth.async_login", _fake_login)
+    login = fake_login()
 
     client = NationalGridClient(config=config, session=session)
 
@@ -127,10 +165,12 @@ async def test_execute_merges_headers(monkeypatch: pytest.MonkeyPatch) -> None:
     assert headers["ocp-apim-subscription-key"] == "sub-key"
     assert headers["X-Test"] == "1"
     assert headers["Content-Type"] == "application/json"
+    assert login.calls[0].username == "user@example.com"
+    assert login.calls[0].password == "super-secret"
 
 
 @pytest.mark.asyncio
-async def test_request_rest_uses_base_url(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_request_rest_uses_base_url(fake_login: Callable[..., _FakeLogin]) -> None:
     config = NationalGridConfig(
         endpoint="https://example.test/graphql",
         rest_base_url="https://example.test/api/",
@@ -142,17 +182,7 @@ async def test_request_rest_uses_base_url(monkeypatch: pytest.MonkeyPatch) -> No
     session.closed = False
     session.request.return_value = _DummyRestResponse({"value": 42})
 
-    async def _fake_login(
-        self,
-        session: aiohttp.ClientSession,
-        username: str,
-        password: str,
-        login_data: LoginData,
-        timeout: float,
-    ) -> tuple[str, int]:
-        return "rest-token", 3600
-
-    monkeypatch.setattr("aionatgrid.client.NationalGridAuth.async_login", _fake_login)
+    fake_login(("rest-token", 3600))
 
     client = NationalGridClient(config=config, session=session)
 
@@ -168,7 +198,7 @@ async def test_request_rest_uses_base_url(monkeypatch: pytest.MonkeyPatch) -> No
 
 
 @pytest.mark.asyncio
-async def test_execute_uses_oidc_token(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_execute_uses_oidc_token(fake_login: Callable[..., _FakeLogin]) -> None:
     config = NationalGridConfig(
         endpoint="https://example.test/graphql",
         username="user@example.com",
@@ -178,19 +208,7 @@ async def test_execute_uses_oidc_token(monkeypatch: pytest.MonkeyPatch) -> None:
     session.closed = False
     session.post.return_value = _DummyResponse({"data": {}})
 
-    async def _fake_login(
-        self,
-        session: aiohttp.ClientSession,
-        username: str,
-        password: str,
-        login_data: LoginData,
-        timeout: float,
-    ) -> tuple[str, int]:
-        assert username == "user@example.com"
-        assert password == "super-secret"
-        return "oidc-token", 3600
-
-    monkeypatch.setattr("aionatgrid.client.NationalGridAuth.async_login", _fake_login)
+    login = fake_login(("oidc-token", 3600))
 
     client = NationalGridClient(config=config, session=session)
 
@@ -199,23 +217,15 @@ async def test_execute_uses_oidc_token(monkeypatch: pytest.MonkeyPatch) -> None:
     _, kwargs = session.post.call_args
     headers = kwargs["headers"]
     assert headers["Authorization"] == "Bearer oidc-token"
+    assert login.calls[0].username == "user@example.com"
+    assert login.calls[0].password == "super-secret"
 
 
 @pytest.mark.asyncio
-async def test_session_uses_configured_connector(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_session_uses_configured_connector(fake_login: Callable[..., _FakeLogin]) -> None:
     """Verify session is created with configured TCPConnector."""
 
-    async def _fake_login(
-        self,
-        session: aiohttp.ClientSession,
-        username: str,
-        password: str,
-        login_data: LoginData,
-        timeout: float,
-    ) -> tuple[str, int]:
-        return "test-token", 3600
-
-    monkeypatch.setattr("aionatgrid.client.NationalGridAuth.async_login", _fake_login)
+    fake_login(("test-token", 3600))
 
     config = NationalGridConfig(
         username="user@example.com",
@@ -232,6 +242,9 @@ async def test_session_uses_configured_connector(monkeypatch: pytest.MonkeyPatch
         assert session.connector is not None
         assert session.connector._limit == 50
         assert session.connector._limit_per_host == 10
+        assert session.connector._keepalive_timeout == 75.0
+        # API calls don't keep cookies; the OIDC login uses its own jar
+        assert isinstance(session.cookie_jar, aiohttp.DummyCookieJar)
         # DNS cache TTL is set internally but not directly accessible for verification
 
 
@@ -247,8 +260,8 @@ class _DummyResponseWithErrors:
     async def __aexit__(self, exc_type, exc, tb) -> bool:  # type: ignore[override]
         return False
 
-    async def json(self, content_type: str | None = None) -> dict[str, object]:
-        return self._payload
+    async def read(self) -> bytes:
+        return json.dumps(self._payload).encode()
 
     def raise_for_status(self) -> None:
         return None
@@ -301,3 +314,580 @@ async def test_graphql_errors_logged_safely(caplog: pytest.LogCaptureFixture) ->
     assert sensitive_account_number not in warning_message
     assert "user@example.com" not in warning_message
     assert "Account" not in warning_message  # Full error message not present
+
+
+@pytest.mark.asyncio
+async def test_login_uses_cookie_session_on_shared_pool(
+    fake_login: Callable[..., _FakeLogin],
+) -> None:
+    """Verify the OIDC login gets a B2C cookie jar but reuses the client's connector."""
+    login = fake_login()
+
+    config = NationalGridConfig(username="user@example.com", password="password")
+    async with NationalGridClient(config=config) as client:
+        session = await client._ensure_session()
+        assert await client._get_access_token(session) == "token"
+
+        login_session, login_connector = login.calls[0].session, login.calls[0].connector
+        assert login_session is not session
+        assert login_connector is session.connector
+        assert isinstance(login_session.cookie_jar, aiohttp.CookieJar)
+        assert login_session.cookie_jar._quote_cookie is False
+        # Closing the login session must leave the shared pool open
+        assert login_session.closed
+        assert session.connector is not None
+        assert not session.connector.closed
+
+
+@pytest.mark.asyncio
+async def test_max_concurrent_requests_limits_in_flight_posts() -> None:
+    """Verify max_concurrent_requests bounds the number of simultaneous requests."""
+    config = NationalGridConfig(
+        endpoint="https://example.test/graphql",
+        max_concurrent_requests=2,
+    )
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+
+    in_flight = 0
+    peak = 0
+
+    class _SlowResponse(_DummyResponse):
+        async def __aenter__(self) -> _SlowResponse:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb) -> bool:  # type: ignore[override]
+            nonlocal in_flight
+            in_flight -= 1
+            return False
+
+    session.post.side_effect = lambda *args, **kwargs: _SlowResponse({"data": {}})
+
+    client = NationalGridClient(config=config, session=session)
+    requests = [GraphQLRequest(query="query Test { value }", variables={"n": n}) for n in range(6)]
+
+    await asyncio.gather(*(client.execute(request) for request in requests))
+
+    assert session.post.call_count == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_many_bounds_concurrency_and_keeps_order() -> None:
+    """Verify execute_many preserves order, caps concurrency and returns failures inline."""
+    config = NationalGridConfig(
+        endpoint="https://example.test/graphql",
+        retry_config=RetryConfig(max_attempts=1),
+    )
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+    in_flight = 0
+    peak = 0
+
+    class _SlowResponse(_DummyResponse):
+        async def __aenter__(self) -> _SlowResponse:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return self
+
+    def _post(url: str, **kwargs: object) -> _DummyResponse:
+        value = json.loads(kwargs["data"])["variables"]["n"]  # type: ignore[arg-type]
+        if value == 2:
+            raise aiohttp.InvalidURL(url)
+        return _SlowResponse({"data": {"n": value}})
+
+    session.post.side_effect = _post
+    client = NationalGridClient(config=config, session=session)
+    requests = [GraphQLRequest(query="query Test { n }", variables={"n": n}) for n in range(5)]
+
+    results = await client.execute_many(requests, concurrency=2)
+
+    assert peak <= 2
+    assert [r.data["n"] for r in results if isinstance(r, GraphQLResponse)] == [0, 1, 3, 4]
+    assert isinstance(results[2], RetryExhaustedError)
+
+
+@pytest.mark.asyncio
+async def test_access_token_reused_until_expiry_buffer(
+    monkeypatch: pytest.MonkeyPatch, fake_login: Callable[..., _FakeLogin]
+) -> None:
+    """Verify the token is cached and refreshed once it is within the expiry buffer."""
+    login = fake_login(("token-1", 3600), ("token-2", 3600))
+
+    config = NationalGridConfig(username="user@example.com", password="password")
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+    client = NationalGridClient(config=config, session=session)
+
+    assert await client._get_access_token(session) == "token-1"
+    assert await client._get_access_token(session) == "token-1"
+
+    monkeypatch.setattr("aionatgrid.client.time.monotonic", lambda: client._token_valid_until + 1)
+    assert await client._get_access_token(session) == "token-2"
+    assert len(login.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_renews_token_before_expiry(
+    monkeypatch: pytest.MonkeyPatch, fake_login: Callable[..., _FakeLogin]
+) -> None:
+    """Verify the opt-in background task logs in again before the token expires."""
+    # The first token is due for a refresh 10ms after the login
+    login = fake_login(("token-1", 360), ("token-2", 3600))
+    monkeypatch.setattr("aionatgrid.client.BACKGROUND_REFRESH_LEAD_SECONDS", 59.99)
+
+    refreshes: list[asyncio.Task[None]] = []
+    real_refresh = NationalGridClient._refresh_token_later
+
+    async def _tracked_refresh(self: NationalGridClient, delay: float) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        refreshes.append(task)
+        await real_refresh(self, delay)
+
+    monkeypatch.setattr(NationalGridClient, "_refresh_token_later", _tracked_refresh)
+
+    config = NationalGridConfig(
+        username="user@example.com", password="password", refresh_token_in_background=True
+    )
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+    client = NationalGridClient(config=config, session=session)
+
+    assert await client._get_access_token(session) == "token-1"
+    await asyncio.sleep(0.05)
+
+    assert len(login.calls) == 2
+    assert client._access_token == "token-2"
+    # The refresh that logged in finishes normally and hands over to the next one
+    first, second = refreshes
+    assert first.done() and not first.cancelled()
+    assert client._refresh_task is second
+
+    await client.close()
+    assert client._refresh_task is None
+    assert second.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_skips_short_lived_tokens(
+    fake_login: Callable[..., _FakeLogin],
+) -> None:
+    """Verify a token too short to refresh ahead doesn't start a login loop."""
+    login = fake_login(("token", 300))
+
+    config = NationalGridConfig(
+        username="user@example.com", password="password", refresh_token_in_background=True
+    )
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+    client = NationalGridClient(config=config, session=session)
+
+    await client._get_access_token(session)
+    await asyncio.sleep(0.01)
+
+    assert len(login.calls) == 1
+    assert client._refresh_task is None
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_pending_login(fake_login: Callable[..., _FakeLogin]) -> None:
+    """Verify close() cancels and awaits a login still in flight."""
+    login = fake_login(delay=3600)
+
+    config = NationalGridConfig(username="user@example.com", password="password")
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+    client = NationalGridClient(config=config, session=session)
+
+    caller = asyncio.create_task(client._get_access_token(session))
+    while not login.calls:
+        await asyncio.sleep(0)
+    inflight = client._inflight["login"]
+
+    await client.close()
+
+    assert inflight.cancelled()
+    assert client._inflight == {}
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+
+
+@pytest.mark.asyncio
+async def test_request_rest_falls_back_to_text_for_non_json_body() -> None:
+    """Verify a non-JSON REST body is returned as text instead of raising."""
+    config = NationalGridConfig(rest_base_url="https://example.test/api/")
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+
+    class _TextResponse(_DummyRestResponse):
+        async def read(self) -> bytes:
+            return b"ok"
+
+    session.request.return_value = _TextResponse(None, content_type="text/plain")
+    client = NationalGridClient(config=config, session=session)
+
+    response = await client.request_rest("GET", "v1/status")
+
+    assert response.data == "ok"
+
+
+def test_request_timeout_reuses_instances() -> None:
+    """Verify per-call timeouts reuse the default or a cached ClientTimeout."""
+    client = NationalGridClient(config=NationalGridConfig(timeout=30.0))
+
+    assert client._request_timeout(None) is client._default_timeout
+    assert client._default_timeout.total == 30.0
+    assert client._request_timeout(5.0) is client._request_timeout(5.0)
+    assert client._request_timeout(5.0).total == 5.0
+
+
+def test_client_supports_weak_references() -> None:
+    """Verify the slotted client can still be weakly referenced."""
+    client = NationalGridClient(config=NationalGridConfig())
+
+    ref = weakref.ref(client)
+
+    assert ref() is client
+    with pytest.raises(AttributeError):
+        client.extra = 1  # type: ignore[attr-defined]
+
+
+def test_package_exports_client_lazily() -> None:
+    """Verify lazily loaded package exports resolve to the real objects."""
+    import aionatgrid
+
+    assert aionatgrid.NationalGridClient is NationalGridClient
+    assert "create_cookie_jar" in dir(aionatgrid)
+    with pytest.raises(AttributeError):
+        aionatgrid.NotAnExport
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_queries_share_one_post() -> None:
+    """Verify concurrent identical queries are coalesced but mutations are not."""
+    config = NationalGridConfig(endpoint="https://example.test/graphql", coalesce_requests=True)
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+
+    class _SlowResponse(_DummyResponse):
+        async def __aenter__(self) -> _SlowResponse:
+            await asyncio.sleep(0.01)
+            return self
+
+    session.post.side_effect = lambda *args, **kwargs: _SlowResponse({"data": {"value": 1}})
+    client = NationalGridClient(config=config, session=session)
+    query = GraphQLRequest(query="query Test { value }")
+    mutation = GraphQLRequest(query="mutation Touch { value }")
+
+    responses = await asyncio.gather(*(client.execute(query) for _ in range(3)))
+    assert session.post.call_count == 1
+    assert all(response.data == {"value": 1} for response in responses)
+    assert client._inflight == {}
+
+    await asyncio.gather(*(client.execute(mutation) for _ in range(2)))
+    assert session.post.call_count == 3
+
+    # Coalescing only applies while a request is in flight
+    await client.execute(query)
+    assert session.post.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_coalesced_callers_get_independent_responses() -> None:
+    """Verify callers sharing one request can't see each other's mutations."""
+    config = NationalGridConfig(
+        endpoint="https://example.test/graphql",
+        rest_base_url="https://example.test/api/",
+        coalesce_requests=True,
+    )
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+
+    class _SlowResponse(_DummyResponse):
+        async def __aenter__(self) -> _SlowResponse:
+            await asyncio.sleep(0.01)
+            return self
+
+    class _SlowRestResponse(_DummyRestResponse):
+        async def __aenter__(self) -> _SlowRestResponse:
+            await asyncio.sleep(0.01)
+            return self
+
+    session.post.return_value = _SlowResponse({"data": {"items": [1]}})
+    session.request.return_value = _SlowRestResponse({"items": [1]})
+    client = NationalGridClient(config=config, session=session)
+    query = GraphQLRequest(query="query Test { items }")
+
+    first, second = await asyncio.gather(client.execute(query), client.execute(query))
+    assert session.post.call_count == 1
+    assert first.data is not None and second.data is not None
+    first.data["items"].append(2)
+    assert second.data == {"items": [1]}
+
+    first_rest, second_rest = await asyncio.gather(
+        client.request_rest("GET", "v1/usage"), client.request_rest("GET", "v1/usage")
+    )
+    assert session.request.call_count == 1
+    first_rest.data["items"].append(2)
+    assert second_rest.data == {"items": [1]}
+
+
+@pytest.mark.asyncio
+async def test_request_rest_revalidates_get_with_etag() -> None:
+    """Verify REST GETs send If-None-Match and reuse the cached payload on 304."""
+    config = NationalGridConfig(rest_base_url="https://example.test/api/")
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+
+    first = _DummyRestResponse({"value": 42})
+    first.headers["ETag"] = '"v1"'
+    not_modified = _DummyRestResponse(None)
+    not_modified.status = 304
+    session.request.side_effect = [
+        first,
+        not_modified,
+        _DummyRestResponse("csv"),
+        _DummyRestResponse({"value": 43}),
+    ]
+    client = NationalGridClient(config=config, session=session)
+
+    first_response = await client.request_rest("GET", "v1/usage")
+    assert first_response.data == {"value": 42}
+    # Neither the original response nor a cache hit aliases the cached data
+    first_response.data["value"] = 0
+    response = await client.request_rest("GET", "v1/usage")
+
+    assert response.data == {"value": 42}
+    assert session.request.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+    response.data["value"] = 1
+    assert client._etag_cache[("https://example.test/api/v1/usage", (), ())][1].data == {
+        "value": 42
+    }
+
+    # Other request headers get their own entry rather than revalidating this one
+    response = await client.request_rest("GET", "v1/usage", headers={"Accept": "text/csv"})
+    assert response.data == "csv"
+    assert "If-None-Match" not in session.request.call_args.kwargs["headers"]
+
+    # Cache-Control: no-cache bypasses revalidation
+    response = await client.request_rest("GET", "v1/usage", headers={"Cache-Control": "no-cache"})
+    assert response.data == {"value": 43}
+    assert "If-None-Match" not in session.request.call_args.kwargs["headers"]
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_posts_one_array_and_falls_back() -> None:
+    """Verify execute_batch sends one array POST and falls back when it is rejected."""
+    config = NationalGridConfig(endpoint="https://example.test/graphql", enable_query_batching=True)
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+    session.post.return_value = _DummyResponse([{"data": {"n": 0}}, {"data": {"n": 1}}])
+    client = NationalGridClient(config=config, session=session)
+    requests = [GraphQLRequest(query="query Test { n }", variables={"n": n}) for n in range(2)]
+
+    results = await client.execute_batch(requests)
+
+    session.post.assert_called_once()
+    batch = json.loads(session.post.call_args.kwargs["data"])
+    assert [payload["variables"] for payload in batch] == [{"n": 0}, {"n": 1}]
+    assert [r.data for r in results if isinstance(r, GraphQLResponse)] == [{"n": 0}, {"n": 1}]
+
+    # A server that doesn't understand batches answers with a single object
+    session.post.reset_mock()
+    session.post.side_effect = [
+        _DummyResponse({"errors": [{"message": "Must provide query string."}]}),
+        _DummyResponse({"data": {"n": 0}}),
+        _DummyResponse({"data": {"n": 1}}),
+    ]
+
+    results = await client.execute_batch(requests)
+
+    assert session.post.call_count == 3
+    assert [r.data for r in results if isinstance(r, GraphQLResponse)] == [{"n": 0}, {"n": 1}]
+
+
+class _StatusResponse(_DummyResponse):
+    def __init__(self, status: int):
+        super().__init__({})
+        self.status = status
+
+    def raise_for_status(self) -> None:
+        raise aiohttp.ClientResponseError(
+            request_info=MagicMock(),
+            history=(),
+            status=self.status,
+            headers={"Retry-After": "0"},  # type: ignore[arg-type]
+        )
+
+
+@pytest.mark.asyncio
+async def test_execute_batch_only_resends_rejected_queries() -> None:
+    """Verify a batch the server may have run, or one with a mutation, isn't re-sent."""
+    config = NationalGridConfig(endpoint="https://example.test/graphql", enable_query_batching=True)
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+    client = NationalGridClient(config=config, session=session)
+    queries = [GraphQLRequest(query="query Test { n }", variables={"n": n}) for n in range(2)]
+    mutations = [GraphQLRequest(query="mutation Touch { n }", variables={"n": n}) for n in range(2)]
+
+    # Timeouts and 5xx may come after the server ran the batch
+    session.post.side_effect = asyncio.TimeoutError()
+    results = await client.execute_batch(mutations)
+    assert session.post.call_count == 1
+    assert all(isinstance(r, GraphQLError) for r in results)
+
+    session.post.reset_mock()
+    session.post.side_effect = [_StatusResponse(502)]
+    results = await client.execute_batch(queries)
+    assert session.post.call_count == 1
+    assert [r.status for r in results if isinstance(r, GraphQLError)] == [502, 502]
+
+    # A rejected batch is re-sent one by one, but never when it holds a mutation
+    session.post.reset_mock()
+    session.post.side_effect = [_StatusResponse(400)]
+    results = await client.execute_batch(mutations)
+    assert session.post.call_count == 1
+    assert all(isinstance(r, GraphQLError) for r in results)
+
+    session.post.reset_mock()
+    session.post.side_effect = [
+        _StatusResponse(429),
+        _DummyResponse({"data": {"n": 0}}),
+        _DummyResponse({"data": {"n": 1}}),
+    ]
+    results = await client.execute_batch(queries)
+    assert session.post.call_count == 3
+    assert [r.data for r in results if isinstance(r, GraphQLResponse)] == [{"n": 0}, {"n": 1}]
+
+
+@pytest.mark.parametrize(
+    "default_headers",
+    [{}, {"X-App": "1"}, {"Content-Type": "application/graphql", "Authorization": "Basic x"}],
+)
+@pytest.mark.parametrize("content_type", ["application/json", None])
+def test_build_headers_matches_config(
+    default_headers: dict[str, str], content_type: str | None
+) -> None:
+    """Verify the client's templated headers equal NationalGridConfig.build_headers."""
+    config = NationalGridConfig(default_headers=default_headers)
+    client = NationalGridClient(config=config)
+
+    for token in ("tok-1", "tok-2", None):
+        expected = config.build_headers(
+            {"X-Call": "1"}, access_token=token, content_type=content_type
+        )
+        actual = client._build_headers(
+            {"X-Call": "1"}, access_token=token, content_type=content_type
+        )
+        assert actual == expected
+
+
+def test_build_headers_uses_construction_time_defaults() -> None:
+    """Verify default_headers changed after construction don't mix with the template."""
+    config = NationalGridConfig()
+    client = NationalGridClient(config=config)
+    config.default_headers = {"Authorization": "Basic x"}
+
+    headers = client._build_headers(None, access_token="tok")
+
+    assert headers["Authorization"] == "Bearer tok"
+
+
+def test_resolve_rest_url_joins_base_and_path() -> None:
+    """Verify relative paths join the base URL with exactly one slash."""
+    client = NationalGridClient(config=NationalGridConfig(rest_base_url="https://example.test/api"))
+
+    assert client._resolve_rest_url("v1/usage") == "https://example.test/api/v1/usage"
+    assert client._resolve_rest_url("/v1/usage") == "https://example.test/api/v1/usage"
+    assert client._resolve_rest_url("https://other.test/x") == "https://other.test/x"
+
+    no_base = NationalGridClient(config=NationalGridConfig(rest_base_url=""))
+    with pytest.raises(ValueError):
+        no_base._resolve_rest_url("v1/usage")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_login(fake_login: Callable[..., _FakeLogin]) -> None:
+    """Verify simultaneous first requests trigger a single OIDC login."""
+    login = fake_login(delay=0.01)
+
+    config = NationalGridConfig(username="user@example.com", password="password")
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+    client = NationalGridClient(config=config, session=session)
+
+    tokens = await asyncio.gather(*(client._get_access_token(session) for _ in range(5)))
+
+    assert tokens == ["token"] * 5
+    assert len(login.calls) == 1
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_ready_session_skips_setup_once_logged_in(
+    fake_login: Callable[..., _FakeLogin],
+) -> None:
+    """Verify the steady state reuses the session and token without the slow path."""
+
+    fake_login()
+
+    config = NationalGridConfig(username="user@example.com", password="password")
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+    client = NationalGridClient(config=config, session=session)
+
+    assert client._ready_session() is None
+    assert await client._prepare_session() == (session, "token")
+    assert client._ready_session() == (session, "token")
+
+    session.closed = True
+    assert client._ready_session() is None
+
+
+@pytest.mark.asyncio
+async def test_anonymous_client_never_logs_in() -> None:
+    """Verify a client without credentials takes the fast path with no token."""
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+    client = NationalGridClient(config=NationalGridConfig(), session=session)
+
+    assert client._needs_auth is False
+    assert client._ready_session() == (session, None)
+    assert await client._get_access_token(session) is None
+
+
+@pytest.mark.asyncio
+async def test_large_response_decoded_off_the_event_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify bodies above the threshold are decoded via asyncio.to_thread."""
+    threaded: list[int] = []
+    real_to_thread = asyncio.to_thread
+
+    async def _to_thread(func, /, *args):  # type: ignore[no-untyped-def]
+        threaded.append(len(args[0]))
+        return await real_to_thread(func, *args)
+
+    monkeypatch.setattr("aionatgrid.client.asyncio.to_thread", _to_thread)
+    monkeypatch.setattr("aionatgrid.client.THREADED_DECODE_THRESHOLD", 64)
+
+    config = NationalGridConfig(endpoint="https://example.test/graphql")
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+    client = NationalGridClient(config=config, session=session)
+
+    session.post.return_value = _DummyResponse({"data": {"v": 1}})
+    assert (await client.execute(GraphQLRequest(query="query A { v }"))).data == {"v": 1}
+    assert threaded == []
+
+    session.post.return_value = _DummyResponse({"data": {"v": "x" * 100}})
+    assert (await client.execute(GraphQLRequest(query="query B { v }"))).data == {"v": "x" * 100}
+    assert len(threaded) == 1
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from aionatgrid.config import DEFAULT_ENDPOINT, NationalGridConfig
+from aionatgrid.config import DEFAULT_ENDPOINT, NationalGridConfig, RetryConfig
 
 
 def test_default_config_values() -> None:
@@ -32,6 +32,7 @@ def test_build_headers_merges_overrides() -> None:
     assert headers["X-Test"] == "1"
     assert headers["Another"] == "2"
     assert headers["Content-Type"] == "application/json"
+    assert "gzip" in headers["Accept-Encoding"]
 
 
 def test_connection_pool_defaults() -> None:
@@ -40,6 +41,12 @@ def test_connection_pool_defaults() -> None:
     assert config.connection_limit == 100
     assert config.connection_limit_per_host == 30
     assert config.dns_cache_ttl == 300
+    assert config.keepalive_timeout == 75.0
+    assert config.coalesce_requests is False
+    assert config.etag_cache_size == 64
+    assert config.enable_query_batching is False
+    assert config.requests_per_second is None
+    assert config.refresh_token_in_background is False
 
 
 def test_connection_pool_overrides() -> None:
@@ -52,3 +59,14 @@ def test_connection_pool_overrides() -> None:
     assert config.connection_limit == 50
     assert config.connection_limit_per_host == 10
     assert config.dns_cache_ttl == 600
+
+
+def test_with_overrides_keeps_nested_config() -> None:
+    """Verify overrides copy the config without converting nested dataclasses."""
+    retry = RetryConfig(max_attempts=5)
+    config = NationalGridConfig(timeout=10.0, retry_config=retry)
+    updated = config.with_overrides(timeout=20.0)
+
+    assert updated.timeout == 20.0
+    assert config.timeout == 10.0
+    assert updated.retry_config is retry
@@ -0,0 +1,95 @@
+"""Tests for the National Grid exception classes."""
+
+from __future__ import annotations
+
+import copy
+import pickle
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from aionatgrid.exceptions import (
+    DataExtractionError,
+    GraphQLError,
+    NationalGridError,
+    RestAPIError,
+    RetryExhaustedError,
+)
+
+_ERRORS = [
+    GraphQLError(
+        "GraphQL request failed with status 500",
+        endpoint="https://example.test/graphql",
+        query="query Test { value }",
+        variables={"id": "123"},
+        status=500,
+        response_body={"errors": []},
+        original_error=ValueError("boom"),
+    ),
+    RestAPIError(
+        "REST request failed with status 503",
+        url="https://example.test/api/v1/usage",
+        method="GET",
+        status=503,
+        response_text="unavailable",
+        original_error=ValueError("boom"),
+    ),
+    RetryExhaustedError(
+        "GraphQL request failed after all retry attempts",
+        attempts=3,
+        last_error=GraphQLError("failed", endpoint="https://example.test/graphql"),
+    ),
+    DataExtractionError("Missing data", path="data.user", response_data={"other": 1}),
+]
+
+
+def _slot_values(error: NationalGridError) -> dict[str, object]:
+    names = [name for cls in type(error).__mro__ for name in getattr(cls, "__slots__", ())]
+    return {name: repr(getattr(error, name)) for name in names}
+
+
+@pytest.mark.parametrize("error", _ERRORS, ids=lambda error: type(error).__name__)
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_error_pickle_round_trip(error: NationalGridError, protocol: int) -> None:
+    """Verify each error survives pickling with its message and context intact."""
+    restored = pickle.loads(pickle.dumps(error, protocol))
+
+    assert type(restored) is type(error)
+    assert restored.args == error.args
+    assert str(restored) == str(error)
+    assert _slot_values(restored) == _slot_values(error)
+
+
+@pytest.mark.parametrize("copier", [copy.copy, copy.deepcopy])
+@pytest.mark.parametrize("error", _ERRORS, ids=lambda error: type(error).__name__)
+def test_error_copy(error: NationalGridError, copier: Callable[[Any], Any]) -> None:
+    """Verify copy and deepcopy rebuild errors without calling __init__."""
+    copied = copier(error)
+
+    assert str(copied) == str(error)
+    assert _slot_values(copied) == _slot_values(error)
+
+
+@pytest.mark.parametrize("error", _ERRORS, ids=lambda error: type(error).__name__)
+def test_error_context_lives_in_slots(error: NationalGridError) -> None:
+    """Verify context attributes are stored in slots rather than the instance __dict__."""
+    error = copy.copy(error)
+
+    assert error.__dict__ == {}
+    for name in _slot_values(error):
+        setattr(error, name, None)
+        assert getattr(error, name) is None
+    assert error.__dict__ == {}
+
+
+def test_error_notes_survive_pickling() -> None:
+    """Verify notes kept in the exception's __dict__ are pickled with the slots."""
+    error = DataExtractionError("Missing data", path="data.user")
+    # Set directly rather than with add_note(), which needs Python 3.11
+    error.__notes__ = ["while extracting linked accounts"]
+
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert restored.__notes__ == ["while extracting linked accounts"]
+    assert restored.path == "data.user"
@@ -282,6 +282,39 @@ class TestExtractEnergyUsages:
             extract_energy_usages(response)
 
 
+class TestExtractPathErrors:
+    """Tests for the messages and paths of errors raised along a data path."""
+
+    @pytest.mark.parametrize(
+        ("data", "message", "path"),
+        [
+            ({}, "Missing 'user' field in response", "data.user"),
+            ({"user": {}}, "Missing 'accountLinks' field in user", "data.user.accountLinks"),
+            (
+                {"user": {"accountLinks": {}}},
+                "Missing 'nodes' field in accountLinks",
+                "data.user.accountLinks.nodes",
+            ),
+            ({"user": []}, "Expected an object for user, got list", "data.user"),
+            (
+                {"user": {"accountLinks": "n/a"}},
+                "Expected an object for accountLinks, got str",
+                "data.user.accountLinks",
+            ),
+        ],
+    )
+    def test_error_message_and_path(self, data: dict[str, object], message: str, path: str) -> None:
+        """Verify each failure names the offending field and stops the path there."""
+        response = GraphQLResponse(data=data)
+
+        with pytest.raises(DataExtractionError) as exc_info:
+            extract_linked_accounts(response)
+
+        assert exc_info.value.args[0] == message
+        assert exc_info.value.path == path
+        assert exc_info.value.response_data == data
+
+
 class TestDataExtractionErrorAttributes:
     """Tests for DataExtractionError attributes."""
 
@@ -313,3 +346,13 @@ class TestDataExtractionErrorAttributes:
 
         error_str = str(exc_info.value)
         assert "Path: data.user.accountLinks" in error_str
+
+    def test_error_str_bounds_large_response_data(self) -> None:
+        """Verify large response data is summarised rather than rendered in full."""
+        data = {"energyUsages": {"nodes": [{"usage": n} for n in range(500)]}}
+        error = DataExtractionError("Missing data", path="data.user", response_data=data)
+
+        preview = str(error).split("Response data: ", 1)[1]
+        assert preview.startswith("{'energyUsages': {'nodes': [")
+        assert "..." in preview
+        assert len(preview) < 200
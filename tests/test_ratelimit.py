@@ -0,0 +1,42 @@
+"""Tests for client-side request pacing."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from aionatgrid.ratelimit import TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_paces() -> None:
+    bucket = TokenBucket(rate=50, burst=2)
+
+    start = time.monotonic()
+    await bucket.acquire()
+    await bucket.acquire()
+    assert time.monotonic() - start < 0.015
+
+    await bucket.acquire()
+    await bucket.acquire()
+    # Two more tokens at 50/s need roughly 40ms
+    assert time.monotonic() - start >= 0.035
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_pause_holds_requests() -> None:
+    bucket = TokenBucket(rate=1000, burst=5)
+    bucket.pause(0.05)
+
+    start = time.monotonic()
+    await bucket.acquire()
+
+    assert time.monotonic() - start >= 0.045
+
+
+def test_token_bucket_rejects_invalid_settings() -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from unittest.mock import MagicMock
 
 import aiohttp
@@ -33,8 +34,8 @@ class _MockResponse:
     async def __aexit__(self, exc_type, exc, tb):
         return False
 
-    async def json(self, content_type=None):
-        return self._payload
+    async def read(self):
+        return json.dumps(self._payload).encode()
 
     async def text(self):
         return str(self._payload)
@@ -254,6 +255,25 @@ async def test_no_retry_on_400_error(monkeypatch: pytest.MonkeyPatch):
     assert call_count == 1  # Should NOT have retried
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("coalesce", [False, True])
+async def test_unencodable_variables_raise_graphql_error(coalesce: bool):
+    """Test that variables that can't be JSON-encoded raise GraphQLError without a request."""
+    config = NationalGridConfig(coalesce_requests=coalesce)
+    session = MagicMock(spec=aiohttp.ClientSession)
+    session.closed = False
+
+    client = NationalGridClient(config=config, session=session)
+    request = GraphQLRequest(query="query Test($at: Date) { value }", variables={"at": object()})
+
+    with pytest.raises(GraphQLError) as exc_info:
+        await client.execute(request)
+
+    assert isinstance(exc_info.value.original_error, TypeError)
+    assert exc_info.value.variables == request.variables
+    session.post.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_retry_on_timeout(monkeypatch: pytest.MonkeyPatch):
     """Test that timeout errors trigger retry."""
@@ -305,24 +325,68 @@ async def test_custom_retry_config():
 
 
 def test_retry_delay_calculation():
-    """Test retry delay calculation with exponential backoff."""
+    """Test retry delay calculation with exponential backoff and full jitter."""
     config = NationalGridConfig(
         retry_config=RetryConfig(initial_delay=1.0, max_delay=10.0, exponential_base=2.0)
     )
     client = NationalGridClient(config=config)
 
-    # First retry (attempt 0)
-    delay_0 = client._calculate_retry_delay(0, config.retry_config)
-    assert 0.75 <= delay_0 <= 1.25  # 1.0 ± 25% jitter
+    # Full jitter draws from [0, initial_delay * base ^ attempt]
+    assert 0 <= client._calculate_retry_delay(0, config.retry_config) <= 1.0
+    assert 0 <= client._calculate_retry_delay(1, config.retry_config) <= 2.0
+    assert 0 <= client._calculate_retry_delay(2, config.retry_config) <= 4.0
 
-    # Second retry (attempt 1)
-    delay_1 = client._calculate_retry_delay(1, config.retry_config)
-    assert 1.5 <= delay_1 <= 2.5  # 2.0 ± 25% jitter
+    # Large attempt should cap at max_delay
+    assert client._calculate_retry_delay(10, config.retry_config) <= 10.0
 
-    # Third retry (attempt 2)
-    delay_2 = client._calculate_retry_delay(2, config.retry_config)
-    assert 3.0 <= delay_2 <= 5.0  # 4.0 ± 25% jitter
 
-    # Large attempt should cap at max_delay
-    delay_large = client._calculate_retry_delay(10, config.retry_config)
-    assert delay_large <= 12.5  # max_delay + 25% jitter
+def test_retry_delay_symmetric_jitter():
+    """Test the ±25% jitter mode."""
+    retry_config = RetryConfig(initial_delay=1.0, max_delay=10.0, jitter_mode="symmetric")
+    client = NationalGridClient(config=NationalGridConfig(retry_config=retry_config))
+
+    assert 0.75 <= client._calculate_retry_delay(0, retry_config) <= 1.25
+    assert 1.5 <= client._calculate_retry_delay(1, retry_config) <= 2.5
+    assert client._calculate_retry_delay(10, retry_config) <= 12.5
+
+
+def test_retry_delay_decorrelated_jitter():
+    """Test decorrelated jitter grows from the previous delay and stays capped."""
+    retry_config = RetryConfig(initial_delay=1.0, max_delay=10.0, jitter_mode="decorrelated")
+    client = NationalGridClient(config=NationalGridConfig(retry_config=retry_config))
+
+    assert 1.0 <= client._calculate_retry_delay(0, retry_config) <= 3.0
+    assert 1.0 <= client._calculate_retry_delay(1, retry_config, previous_delay=2.0) <= 6.0
+    assert 1.0 <= client._calculate_retry_delay(5, retry_config, previous_delay=9.0) <= 10.0
+
+
+def test_retry_delay_honors_retry_after():
+    """Test that a Retry-After header overrides the backoff, capped at max_delay."""
+    config = NationalGridConfig(retry_config=RetryConfig(initial_delay=1.0, max_delay=10.0))
+    client = NationalGridClient(config=config)
+
+    def _error(retry_after: str) -> RestAPIError:
+        original = aiohttp.ClientResponseError(
+            request_info=MagicMock(),
+            history=(),
+            status=429,
+            headers={"Retry-After": retry_after},
+        )
+        return RestAPIError(
+            "rate limited",
+            url="https://example.test",
+            method="GET",
+            status=429,
+            original_error=original,
+        )
+
+    assert client._calculate_retry_delay(0, config.retry_config, _error("3")) == 3.0
+    assert client._calculate_retry_delay(0, config.retry_config, _error("120")) == 10.0
+    assert (
+        client._calculate_retry_delay(
+            0, config.retry_config, _error("Wed, 21 Oct 2015 07:28:00 GMT")
+        )
+        == 0.0
+    )
+    # Unparseable values fall back to exponential backoff
+    assert 0 <= client._calculate_retry_delay(0, config.retry_config, _error("soon")) <= 1.0
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import date
+import json
+from datetime import date, datetime, timezone
 from unittest.mock import MagicMock
 
 import aiohttp
 import pytest
 
-from aionatgrid.client import NationalGridClient
+from aionatgrid.client import NationalGridClient, _year_month_back
 from aionatgrid.config import NationalGridConfig
 from aionatgrid.exceptions import DataExtractionError
 
@@ -25,8 +26,8 @@ class _DummyResponse:
     async def __aexit__(self, exc_type, exc, tb) -> bool:  # type: ignore[override]
         return False
 
-    async def json(self, content_type: str | None = None) -> dict[str, object]:
-        return self._payload
+    async def read(self) -> bytes:
+        return json.dumps(self._payload).encode()
 
     def raise_for_status(self) -> None:
         return None
@@ -151,7 +152,7 @@ async def test_get_billing_account_passes_account_number(
     await client.get_billing_account("my-account-123")
 
     _, kwargs = mock_session.post.call_args
-    payload = kwargs["json"]
+    payload = json.loads(kwargs["data"])
     assert payload["variables"]["accountNumber"] == "my-account-123"
 
 
@@ -189,7 +190,7 @@ async def test_get_energy_usage_costs_accepts_date_object(
 
     # Verify date was converted to ISO string
     _, kwargs = mock_session.post.call_args
-    payload = kwargs["json"]
+    payload = json.loads(kwargs["data"])
     assert payload["variables"]["date"] == "2024-01-15"
 
 
@@ -224,7 +225,7 @@ async def test_get_energy_usage_costs_accepts_string_date(
 
     assert len(costs) == 1
     _, kwargs = mock_session.post.call_args
-    payload = kwargs["json"]
+    payload = json.loads(kwargs["data"])
     assert payload["variables"]["date"] == "2024-02-20"
     assert payload["variables"]["companyCode"] == "KEDNE"
 
@@ -266,7 +267,7 @@ async def test_get_energy_usages_passes_variables(
     await client.get_energy_usages("acct-001", 202301, first=24)
 
     _, kwargs = mock_session.post.call_args
-    payload = kwargs["json"]
+    payload = json.loads(kwargs["data"])
     assert payload["variables"]["accountNumber"] == "acct-001"
     assert payload["variables"]["from"] == 202301
     assert payload["variables"]["first"] == 24
@@ -327,3 +328,114 @@ async def test_get_linked_accounts_returns_empty_list(
     accounts = await client.get_linked_accounts()
 
     assert accounts == []
+
+
+class _DummyRestResponse:
+    """Mock response for REST requests."""
+
+    def __init__(self, payload: object):
+        self._payload = payload
+        self.headers = {"Content-Type": "application/json"}
+        self.status = 200
+
+    async def __aenter__(self) -> _DummyRestResponse:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:  # type: ignore[override]
+        return False
+
+    async def read(self) -> bytes:
+        return json.dumps(self._payload).encode()
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_get_interval_reads_formats_datetime(
+    mock_session: MagicMock, config: NationalGridConfig
+) -> None:
+    """Verify get_interval_reads formats datetimes as YYYY-MM-DD HH:MM:SS."""
+    mock_session.request.return_value = _DummyRestResponse(
+        [{"startTime": "2024-01-01T00:00:00-05:00", "endTime": "x", "value": 1.5}]
+    )
+
+    client = NationalGridClient(config=config, session=mock_session)
+    reads = await client.get_interval_reads(
+        "PREM-001",
+        "SP-001",
+        datetime(2024, 1, 1, 6, 30, 15, 123456, tzinfo=timezone.utc),
+    )
+
+    assert reads[0]["value"] == 1.5
+    _, kwargs = mock_session.request.call_args
+    assert kwargs["params"]["StartDateTime"] == "2024-01-01 06:30:15"
+
+
+@pytest.mark.asyncio
+async def test_get_energy_usages_defaults_from_month_to_months_back(
+    mock_session: MagicMock, config: NationalGridConfig, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify get_energy_usages derives from_month from months_back when omitted."""
+
+    class _FixedDate(date):
+        @classmethod
+        def today(cls) -> _FixedDate:
+            return cls(2024, 3, 15)
+
+    monkeypatch.setattr("aionatgrid.client.date", _FixedDate)
+    mock_session.post.return_value = _DummyResponse({"data": {"energyUsages": {"nodes": []}}})
+
+    client = NationalGridClient(config=config, session=mock_session)
+    await client.get_energy_usages("acct-001", months_back=15)
+
+    _, kwargs = mock_session.post.call_args
+    assert json.loads(kwargs["data"])["variables"]["from"] == 202212
+
+
+def test_year_month_back_wraps_years() -> None:
+    """Verify the YYYYMM arithmetic handles year boundaries."""
+    assert _year_month_back(date(2024, 3, 15), 12) == 202303
+    assert _year_month_back(date(2024, 1, 1), 1) == 202312
+    assert _year_month_back(date(2024, 12, 31), 0) == 202412
+
+
+@pytest.mark.asyncio
+async def test_get_energy_usage_summary_uses_one_request(
+    mock_session: MagicMock, config: NationalGridConfig
+) -> None:
+    """Verify usages and costs come back from a single combined query."""
+    mock_session.post.return_value = _DummyResponse(
+        {
+            "data": {
+                "energyUsages": {
+                    "nodes": [{"usage": 500, "usageType": "ELECTRIC", "usageYearMonth": 202401}]
+                },
+                "energyUsageCosts": {
+                    "nodes": [
+                        {"date": "2024-01-15", "fuelType": "ELECTRIC", "amount": 1.5, "month": 1}
+                    ]
+                },
+            }
+        }
+    )
+
+    client = NationalGridClient(config=config, session=mock_session)
+    usages, costs = await client.get_energy_usage_summary(
+        "acct-001", date(2024, 1, 15), "NECO", from_month=202301
+    )
+
+    assert usages[0]["usage"] == 500
+    assert costs[0]["amount"] == 1.5
+    mock_session.post.assert_called_once()
+    payload = json.loads(mock_session.post.call_args.kwargs["data"])
+    assert "energyUsages(" in payload["query"]
+    assert "energyUsageCosts(" in payload["query"]
+    assert payload["query"].count("$accountNumber: String!") == 1
+    assert payload["variables"] == {
+        "accountNumber": "acct-001",
+        "from": 202301,
+        "first": 12,
+        "date": "2024-01-15",
+        "companyCode": "NECO",
+    }